@@ -13,7 +13,7 @@ from datetime import datetime
 from dotenv import load_dotenv
 from typing import List, Dict
 
-from scraper import JobPortalScraper
+from scraper import JobPortalScraper, JobRecord, _ERROR_SOURCES, _TTLCache
 from generator import JobDescriptionGenerator
 
 # Load environment variables
@@ -72,6 +72,34 @@ def initialize_session_state():
         st.session_state.api_key_validated = False
 
 
+@st.cache_resource
+def get_scraper() -> JobPortalScraper:
+    """One scraper (and HTTP connection pool) shared across Streamlit reruns and sessions."""
+    return JobPortalScraper()
+
+
+@st.cache_resource
+def get_job_url_cache() -> _TTLCache:
+    """Hour-long memo of intelligent job URL searches, shared across Streamlit reruns and sessions."""
+    return _TTLCache(maxsize=256, ttl=3600)
+
+
+def search_job_url(company: str, job_title: str, api_key: str):
+    """
+    Intelligent job URL search, memoized so Streamlit reruns with the same inputs don't re-scrape.
+    Keyed on whether an API key was given, never on the key itself; search-page fallbacks and
+    error placeholders are not memoized, so the next run searches again.
+    """
+    key = (company, job_title, bool(api_key))
+    cache = get_job_url_cache()
+    result = cache.get(key)
+    if result is None:
+        result = get_scraper().intelligent_job_url_search(company, job_title, api_key)
+        if result and result['source'] not in _ERROR_SOURCES and 'search' not in result['source'].lower():
+            cache.set(key, result)
+    return result
+
+
 def validate_api_key(api_key: str) -> bool:
     """Validate OpenAI API key."""
     if not api_key or not api_key.startswith('sk-'):
@@ -104,8 +132,8 @@ def display_web_search_results(results: List[Dict]):
 
 
 def process_single_job(company: str, job_title: str, job_description: str, 
-                       use_web_search: bool, api_key: str, linkedin_url: str = ""):
-    """Process a single job description request."""
+                       use_web_search: bool, api_key: str, linkedin_url: str = "", force_refresh: bool = False):
+    """Process a single job description request (force_refresh skips the cached description)."""
     
     with st.spinner("🔍 Searching job portals..." if use_web_search else "⏳ Generating job description..."):
         try:
@@ -118,21 +146,21 @@ def process_single_job(company: str, job_title: str, job_description: str,
             
             # Tavily-style fast intelligent search
             if use_web_search or linkedin_url:
-                scraper = JobPortalScraper()
+                scraper = get_scraper()
                 
                 # If user provided URL, use it directly
                 if linkedin_url and ('linkedin.com' in linkedin_url or 'careers.gov.sg' in linkedin_url):
                     st.info(f"📎 Using provided URL: {linkedin_url}")
                     # Extract from provided URL
                     if 'careers.gov.sg' in linkedin_url:
-                        result = {'url': linkedin_url, 'source': 'career@gov', 'title': job_title, 'company': company, 'description': 'Government job posting'}
+                        result = JobRecord(url=linkedin_url, source='career@gov', title=job_title, company=company, description='Government job posting')
                     else:
-                        result = scraper._scrape_linkedin_fast(linkedin_url) or {'url': linkedin_url, 'source': 'LinkedIn', 'title': job_title, 'company': company, 'description': 'Job posting'}
+                        result = scraper._scrape_linkedin_fast(linkedin_url) or JobRecord(url=linkedin_url, source='LinkedIn', title=job_title, company=company, description='Job posting')
                     search_results = [result]
                 else:
                     # Fast intelligent search (Tavily-style)
                     st.info(f"⚡ Searching for: **{company}** - {job_title}")
-                    result = scraper.intelligent_job_url_search(company, job_title, api_key)
+                    result = search_job_url(company, job_title, api_key)
                     
                     if result:
                         if 'search' not in result['source'].lower():
@@ -159,7 +187,8 @@ def process_single_job(company: str, job_title: str, job_description: str,
                     company=company,
                     job_title=job_title,
                     initial_description=job_description,
-                    web_search_results=web_results_text
+                    web_search_results=web_results_text,
+                    force_refresh=force_refresh
                 )
                 
                 st.session_state.generated_description = generated_desc
@@ -171,8 +200,8 @@ def process_single_job(company: str, job_title: str, job_description: str,
             return False
 
 
-def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str) -> pd.DataFrame:
-    """Process Excel file with multiple job entries."""
+def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str, force_refresh: bool = False) -> pd.DataFrame:
+    """Process Excel file with multiple job entries (force_refresh skips cached descriptions)."""
     
     # Validate required columns
     required_cols = ['Company', 'Job Title']
@@ -188,7 +217,7 @@ def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str) ->
     
     # Initialize components
     generator = JobDescriptionGenerator(api_key=api_key)
-    scraper = JobPortalScraper() if use_web_search else None
+    scraper = get_scraper() if use_web_search else None
     
     # Create results DataFrame starting with original data
     results_df = df.copy()
@@ -204,6 +233,13 @@ def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str) ->
     progress_bar = st.progress(0)
     status_text = st.empty()
     
+    # Fast intelligent search for all rows up front (bounded concurrency)
+    search_results = {}
+    if use_web_search and scraper:
+        status_text.text(f"Searching job portals for {len(df)} jobs...")
+        queries = list(zip(df['Company'].astype(str), df['Job Title'].astype(str)))
+        search_results = dict(zip(df.index, scraper.intelligent_job_url_search_batch(queries, api_key)))
+    
     for idx, row in df.iterrows():
         status_text.text(f"Processing {idx + 1}/{len(df)}: {row['Job Title']} at {row['Company']}")
         progress_bar.progress((idx + 1) / len(df))
@@ -216,8 +252,8 @@ def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str) ->
             # Fast intelligent search if enabled
             web_results_text = ""
             if use_web_search and scraper:
-                # Tavily-style fast search
-                result = scraper.intelligent_job_url_search(company, job_title, api_key)
+                # Tavily-style fast search (results fetched in batch above)
+                result = search_results.get(idx)
                 if result:
                     web_results_text = f"**Source:** [{result['source']}]({result['url']})\n\n"
                     web_results_text += f"**Title:** {result['title']}\n"
@@ -229,7 +265,8 @@ def process_excel_file(df: pd.DataFrame, use_web_search: bool, api_key: str) ->
                 company=company,
                 job_title=job_title,
                 initial_description=job_description,
-                web_search_results=web_results_text
+                web_search_results=web_results_text,
+                force_refresh=force_refresh
             )
             
             # Parse the generated description to extract components
@@ -392,6 +429,12 @@ def main():
         if use_web_search:
             st.info("Will search: LinkedIn, Indeed, JobStreet, MyCareersFuture, Careers@Gov")
         
+        force_refresh = st.checkbox(
+            "🔄 Regenerate Descriptions",
+            value=False,
+            help="Generated descriptions are reused for a day for the same inputs - tick to write fresh ones"
+        )
+        
         st.divider()
         
         # About Us button
@@ -564,7 +607,7 @@ job-description-generator/
             if not company or not job_title:
                 st.error("[ERROR] Please provide both Company Name and Job Title")
             else:
-                success = process_single_job(company, job_title, job_description, use_web_search, api_key, linkedin_url)
+                success = process_single_job(company, job_title, job_description, use_web_search, api_key, linkedin_url, force_refresh)
                 
                 if success:
                     st.success("[SUCCESS] Job description generated successfully!")
@@ -637,7 +680,7 @@ job-description-generator/
                     st.divider()
                     st.subheader("⏳ Processing...")
                     
-                    result_df = process_excel_file(df, use_web_search, api_key)
+                    result_df = process_excel_file(df, use_web_search, api_key, force_refresh)
                     
                     if result_df is not None:
                         st.success("[SUCCESS] Processing complete!")
@@ -8,15 +8,24 @@ company names, and job titles.
 
 import pandas as pd
 import re
+import asyncio
 from typing import Tuple, Optional, Dict, List
 import logging
 from difflib import SequenceMatcher
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str) -> OpenAI:
+    """One OpenAI client per key, so every classification reuses its pooled HTTPS connections."""
+    return OpenAI(api_key=api_key)
+
+
 class SingaporeClassifier:
     """Classifier for SSIC and SSO codes based on job and company information."""
     
@@ -621,7 +630,7 @@ class SingaporeClassifier:
             Generated company description focusing on industry, business activities, and sector
         """
         try:
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             prompt = f"""Based on the company name and job information provided, generate a brief company description that focuses EXCLUSIVELY on the company's industry sector and primary business activities. This will be used specifically for Singapore Standard Industrial Classification (SSIC) purposes.
 
@@ -708,7 +717,7 @@ Be precise and use industry-standard classifications."""
             Tuple of (ssic_code, ssic_title, confidence_score)
         """
         try:
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             # Get top candidate SSIC codes using company analysis
             candidates = self._get_ssic_candidates_from_company_analysis(company_description)
@@ -996,7 +1005,7 @@ Return ONLY the 5-digit numeric SSIC code that best represents the organization'
             Tuple of (sso_code, sso_title, confidence_score)
         """
         try:
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             # Get top candidate SSO codes using traditional matching first
             candidates = self._get_sso_candidates(company, job_title, job_description)
@@ -1187,6 +1196,35 @@ SSO Code:"""
                 'sso': {'code': 'Unknown', 'title': 'Classification failed', 'confidence': 0}
             }
     
+    def classify_jobs(self, jobs: List[Dict[str, str]], api_key: Optional[str] = None,
+                      max_workers: int = 4) -> List[Dict[str, any]]:
+        """
+        Classify several jobs concurrently (the OpenAI calls for each job overlap).
+        
+        Args:
+            jobs: List of dicts with company, job_title and job_description
+            api_key: OpenAI API key for company description generation (optional)
+            max_workers: Maximum number of jobs classified at once
+            
+        Returns:
+            List of classification results in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            # executor.map preserves input order
+            return list(executor.map(lambda job: self.classify_job(**job, api_key=api_key), jobs))
+    
+    async def classify_job_async(self, company: str, job_title: str, job_description: str,
+                                 api_key: Optional[str] = None) -> Dict[str, any]:
+        """Awaitable classify_job; the classification (and its OpenAI calls) runs on a worker thread."""
+        return await asyncio.to_thread(self.classify_job, company, job_title, job_description, api_key)
+    
+    async def classify_jobs_async(self, jobs: List[Dict[str, str]], api_key: Optional[str] = None) -> List[Dict[str, any]]:
+        """Awaitable classify_jobs: all jobs are gathered at once, results in the same order as jobs."""
+        return list(await asyncio.gather(*(self.classify_job_async(**job, api_key=api_key) for job in jobs)))
+    
     def get_classification_summary(self, classification: Dict[str, any]) -> str:
         """Generate a summary text of the classification results with 5-digit SSIC emphasis."""
         ssic = classification['ssic']
@@ -1224,7 +1262,7 @@ SSO Code:"""
                                      job_description: str, api_key: str) -> Dict[str, any]:
         """Use AI to enhance classification accuracy by understanding context better."""
         try:
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             # Get initial classification
             base_classification = self.classify_job(company, job_title, job_description)
@@ -1274,6 +1312,12 @@ Respond with just: GOOD if classifications are appropriate, or suggest better ma
             return self.classify_job(company, job_title, job_description)
 
 
+@lru_cache(maxsize=1)
+def get_classifier() -> SingaporeClassifier:
+    """Shared classifier with the default SSIC/SSO tables, loaded from the Excel files only once per process."""
+    return SingaporeClassifier()
+
+
 if __name__ == "__main__":
     # Test the classifier
     classifier = SingaporeClassifier()
@@ -0,0 +1,112 @@
+"""
+Shared pytest fixtures for the test scripts
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+import generator
+import scraper as scraper_module
+from classifier import get_classifier
+from scraper import JobPortalScraper
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# One logging setup for the whole run (script-style test modules' own basicConfig calls become no-ops)
+logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
+
+# .env is read once per session; test modules use the api_key fixture (or API_KEY when run as scripts)
+load_dotenv()
+API_KEY = os.getenv('OPENAI_API_KEY')
+
+# Job cases shared by the rule-based SSIC/SSO tests (test_5digit_ssic.py, test_ssic_only.py), parsed once
+SSIC_CASES = json.loads((Path(__file__).parent / 'fixtures' / 'ssic_cases.json').read_bytes())
+
+
+# Scripts that hit the live network as soon as they are imported (they have no test functions to mark)
+NETWORK_SCRIPTS = frozenset({'test_ai_url_discovery.py', 'test_intelligent_search.py', 'test_url_display.py'})
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runnetwork", action="store_true", default=False,
+                     help="run tests that hit live job portals / search engines")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: test hits the live network (needs --runnetwork)")
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Don't even import the network scripts unless --runnetwork is given."""
+    if collection_path.name in NETWORK_SCRIPTS and not config.getoption("--runnetwork"):
+        return True
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runnetwork"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --runnetwork")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_caches(tmp_path_factory):
+    """
+    Empty search and generation caches for the run, so results never come from an earlier run
+    and network tests always exercise the live portals.
+    """
+    patch = pytest.MonkeyPatch()
+    if diskcache is not None:
+        search_cache = scraper_module._DiskTTLCache(str(tmp_path_factory.mktemp('scraper_cache')), maxsize=512, ttl=3600)
+        patch.setattr(generator, '_GENERATION_CACHE', diskcache.Cache(str(tmp_path_factory.mktemp('generator_cache'))))
+    else:
+        search_cache = scraper_module._TTLCache(maxsize=512, ttl=3600)
+    patch.setattr(scraper_module, '_SEARCH_CACHE', search_cache)
+    yield
+    patch.undo()
+
+
+def ssic_case_id(case):
+    """Readable pytest id for an SSIC case."""
+    return f"{case['company']}-{case['job_title']}"
+
+
+@pytest.fixture(scope="session")
+def api_key():
+    """OpenAI API key from the environment / .env, or None."""
+    return API_KEY
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    """One JobPortalScraper for the whole run - it keeps no per-search state between calls."""
+    return JobPortalScraper()
+
+
+@pytest.fixture(scope="session")
+def classifier():
+    """One SingaporeClassifier for the whole run - the SSIC/SSO tables are only loaded once."""
+    return get_classifier()
+
+
+@pytest.fixture(scope="session")
+def ssic_cases():
+    """The shared SSIC job cases (fixtures/ssic_cases.json)."""
+    return SSIC_CASES
+
+
+@pytest.fixture(scope="session")
+def ssic_results(classifier, ssic_cases):
+    """SSIC_CASES classified once (without API key, concurrently), in SSIC_CASES order."""
+    return classifier.classify_jobs(ssic_cases, api_key=None)
@@ -4,17 +4,47 @@ Uses OpenAI to generate comprehensive job descriptions based on user input and w
 """
 
 import os
-from typing import Optional, Dict, List
+import hashlib
+from typing import Optional, Dict, List, Tuple
 import logging
 from openai import OpenAI
 from dotenv import load_dotenv
 from classifier import SingaporeClassifier
 
+try:
+    import diskcache  # keeps generated descriptions across app restarts / test runs
+except ImportError:
+    diskcache = None
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Generated descriptions, keyed on the normalized request (see _generation_key);
+# GENERATOR_CACHE_DIR moves the cache, e.g. off a read-only working directory
+_GENERATION_CACHE = None
+if diskcache is not None:
+    try:
+        _GENERATION_CACHE = diskcache.Cache(os.getenv('GENERATOR_CACHE_DIR', '.generator_cache'))
+    except OSError as e:
+        logger.warning(f"Generation cache disabled: {str(e)}")
+_GENERATION_CACHE_TTL = 24 * 3600
+
+
+def _normalize(text: str) -> str:
+    """Lowercased text with runs of whitespace collapsed, so trivially different inputs share a key."""
+    return ' '.join(text.lower().split())
+
+
+def _generation_key(model: str, company: str, job_title: str, initial_description: str,
+                    web_search_results: str) -> tuple:
+    """Cache key for a generation request; the (possibly long) free-text inputs are hashed."""
+    digest = hashlib.sha256(
+        f"{_normalize(initial_description)}\0{_normalize(web_search_results)}".encode('utf-8')
+    ).hexdigest()
+    return ('generate_job_description', model, _normalize(company), _normalize(job_title), digest)
+
 
 class JobDescriptionGenerator:
     """Generates detailed job descriptions using AI."""
@@ -51,10 +81,13 @@ class JobDescriptionGenerator:
         job_title: str,
         initial_description: str = "",
         web_search_results: str = "",
-        model: str = "gpt-5-mini"
+        model: str = "gpt-5-mini",
+        force_refresh: bool = False
     ) -> str:
         """
         Generate a comprehensive job description using AI.
+        Results are cached for a day per (model, company, job title, inputs), ignoring case and spacing;
+        descriptions whose classification step failed are not cached.
         
         Args:
             company: Company name
@@ -62,10 +95,34 @@ class JobDescriptionGenerator:
             initial_description: User-provided initial description (optional)
             web_search_results: Scraped job descriptions from web (optional)
             model: OpenAI model to use (default: gpt-5-mini for cost efficiency)
+            force_refresh: Ignore any cached description and generate a new one
             
         Returns:
             Generated detailed job description
         """
+        key = _generation_key(model, company, job_title, initial_description, web_search_results)
+        if _GENERATION_CACHE is not None and not force_refresh:
+            cached = _GENERATION_CACHE.get(key)
+            if cached is not None:
+                logger.info(f"Cache hit: job description for {job_title} at {company}")
+                return cached
+        
+        description, classified = self._generate_job_description_uncached(
+            company, job_title, initial_description, web_search_results, model
+        )
+        if _GENERATION_CACHE is not None and classified:
+            _GENERATION_CACHE.set(key, description, expire=_GENERATION_CACHE_TTL)
+        return description
+    
+    def _generate_job_description_uncached(
+        self,
+        company: str,
+        job_title: str,
+        initial_description: str,
+        web_search_results: str,
+        model: str
+    ) -> Tuple[str, bool]:
+        """Call OpenAI and classify the result (see generate_job_description); returns (description, classified)."""
         try:
             # Build the prompt
             prompt = self._build_prompt(company, job_title, initial_description, web_search_results)
@@ -110,7 +167,7 @@ class JobDescriptionGenerator:
                 except Exception as e:
                     logger.warning(f"Classification failed: {str(e)}")
             
-            return generated_description + classification_text
+            return generated_description + classification_text, bool(classification_text)
             
         except Exception as e:
             logger.error(f"Error generating job description: {str(e)}")
@@ -180,17 +237,24 @@ Do not include qualifications, requirements, benefits, or other sections - just
         """
         results = []
         
+        # Search the portals for every job up front (concurrently) instead of one job at a time;
+        # if the batch search fails, every job is still generated, just without web results
+        all_search_results = []
+        if include_web_search and scraper:
+            try:
+                all_search_results = scraper.search_many(
+                    [(job.get('job_title', ''), job.get('company', '')) for job in job_data]
+                )
+            except Exception as e:
+                logger.warning(f"Batch web search failed, generating without web results: {str(e)}")
+        
         for idx, job in enumerate(job_data, 1):
             logger.info(f"Processing job {idx}/{len(job_data)}: {job.get('job_title')} at {job.get('company')}")
             
             try:
                 web_results = ""
-                if include_web_search and scraper:
-                    search_results = scraper.search_all_portals(
-                        job.get('job_title', ''),
-                        job.get('company', '')
-                    )
-                    web_results = scraper.extract_job_details(search_results)
+                if all_search_results:
+                    web_results = scraper.extract_job_details(all_search_results[idx - 1])
                 
                 generated_desc = self.generate_job_description(
                     company=job.get('company', ''),
@@ -4,40 +4,617 @@ Searches job portals without Selenium for Streamlit Community Cloud deployment.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+import re
+import json
+import asyncio
 import time
 import random
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache, wraps
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import List, Dict, Optional, Tuple, Union
 import logging
-import streamlit as st
+import os
+import ssl
+import threading
+from types import MappingProxyType
+from html import unescape
+from urllib.parse import urlsplit, urlunsplit, parse_qs, parse_qsl, urlencode, quote_plus
+
+try:
+    from lxml import etree, html as lxml_html  # C parser backend for BeautifulSoup, and direct XPath
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    etree = lxml_html = None
+    _HTML_PARSER = 'html.parser'
+
+try:
+    import diskcache  # persists the portal search cache across app restarts
+except ImportError:
+    diskcache = None
+
+try:
+    from orjson import loads as _json_loads  # faster JSON-LD parsing; raises a ValueError subclass like json
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # C parser for pure CSS extraction
+except ImportError:
+    HTMLParser = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Silence per-request warnings once for scrapers created with verify_ssl=False
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-class JobPortalScraper:
-    """Scrapes job descriptions from job portals - Cloud compatible version."""
+# Company abbreviation -> expanded name (matched as whole words; the first one in the name wins)
+_COMPANY_MAP = {
+    # Government ministries
+    'mindef': "Ministry of Defence Singapore",
+    'mod': "Ministry of Defence Singapore",
+    'moe': "Ministry of Education Singapore",
+    'moh': "Ministry of Health Singapore",
+    'mom': "Ministry of Manpower Singapore",
+    'mfa': "Ministry of Foreign Affairs Singapore",
+    'mha': "Ministry of Home Affairs Singapore",
+    'mtc': "Ministry of Communications and Information Singapore",
+    'mci': "Ministry of Communications and Information Singapore",
+    'mnd': "Ministry of National Development Singapore",
+    'mof': "Ministry of Finance Singapore",
+    'mti': "Ministry of Trade and Industry Singapore",
+    # Statutory boards
+    'iras': "Inland Revenue Authority of Singapore",
+    'cpf': "Central Provident Fund Board Singapore",
+    'hdb': "Housing Development Board Singapore",
+    'lta': "Land Transport Authority Singapore",
+    'nea': "National Environment Agency Singapore",
+}
+
+# Whole-word abbreviations only, so 'lta' doesn't match "Delta"; 'mod' only expands on an exact match
+_COMPANY_ABBREV_RE = re.compile(r'\b(?:%s)\b' % '|'.join(key for key in _COMPANY_MAP if key != 'mod'))
+
+_GOV_KEYWORDS_RE = re.compile(
+    r'\b(ministry|government|statutory board|agency|authority|board|singapore armed forces|saf)\b'
+)
+
+
+@dataclass(slots=True, frozen=True)
+class JobRecord(Mapping):
+    """
+    One job posting or portal search result.
+    
+    Slotted and immutable, so cached results can be shared safely. Records still read like the
+    dicts they replaced (job['title'], job.get('url'), 'url' in job); a url of None counts as absent.
+    """
+    title: str
+    company: str
+    description: str
+    source: str
+    url: Optional[str] = None
+    
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None) if key in _JOB_RECORD_FIELDS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __iter__(self):
+        return (name for name in _JOB_RECORD_FIELDS if getattr(self, name) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Plain dict for serialization / UI code that needs a real dict."""
+        return dict(self.items())
+
+
+_JOB_RECORD_FIELDS = tuple(field.name for field in fields(JobRecord))
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools share one pre-built SSLContext."""
+    
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _unverified_ssl_context() -> ssl.SSLContext:
+    """Single no-verification TLS context shared by every verify_ssl=False scraper."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+@lru_cache(maxsize=2)
+def _shared_session(verify_ssl: bool = True) -> requests.Session:
+    """Process-wide pooled session, one per verify_ssl setting, shared by every JobPortalScraper."""
+    return _build_session(verify_ssl)
+
+
+def _build_session(verify_ssl: bool = True) -> requests.Session:
+    """New keep-alive session with the scraper's default headers, retry policy and connection pools."""
+    session = requests.Session()
+    session.verify = verify_ssl
+    session.headers.update(_DEFAULT_HEADERS)
+    
+    # Pooled keep-alive connections; backoff (honouring Retry-After) only when a portal throttles or errors
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    if verify_ssl:
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+    else:
+        # Configure certificate skipping once on the pools rather than per request
+        adapter = _SSLContextAdapter(
+            _unverified_ssl_context(), pool_connections=20, pool_maxsize=20, max_retries=retry
+        )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _canonicalize_url(url: str) -> str:
+    """Drop tracking parameters, fragment and trailing slash, and lowercase the scheme/host."""
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _TRACKING_PARAMS and not key.startswith('utm_')
+    ]
+    return urlunsplit((
+        (parts.scheme or 'https').lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/') or '/',
+        urlencode(query),
+        ''
+    ))
+
+
+def _linkedin_job_id(url: Optional[str]) -> Optional[str]:
+    """Numeric posting ID of a LinkedIn job URL, or None if the URL is not a job posting."""
+    match = _LINKEDIN_JOB_ID_RE.search(url or '')
+    return match.group(1) if match else None
+
+
+def _name_tokens(name: str) -> frozenset:
+    """Normalized word set of a company name, ignoring legal suffixes and filler words."""
+    return frozenset(_NAME_TOKEN_RE.findall(name.lower())) - _NAME_STOPWORDS
+
+
+def _company_similarity(target_tokens: List[frozenset], company: str) -> float:
+    """Best Jaccard similarity between a candidate company and any of the target names."""
+    tokens = _name_tokens(company)
+    if not tokens:
+        return 0.0
+    return max((len(tokens & target) / len(tokens | target) for target in target_tokens if target), default=0.0)
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire ttl seconds after being stored."""
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
+    def set(self, key, value, ttl: Optional[float] = None):
+        """Store a value for ttl seconds (default: the cache's ttl)."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _DiskTTLCache:
+    """_TTLCache in front of an on-disk diskcache.Cache with the same TTL, shared across processes."""
+    
+    def __init__(self, directory: str, maxsize: int = 512, ttl: float = 3600):
+        self.ttl = ttl
+        self._memory = _TTLCache(maxsize=maxsize, ttl=ttl)
+        self._disk = diskcache.Cache(directory)
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired in both layers."""
+        value = self._memory.get(key)
+        if value is None:
+            value, expires_at = self._disk.get(key, expire_time=True)
+            if value is not None:
+                # Promote for the disk entry's remaining lifetime only, not a fresh full TTL
+                self._memory.set(key, value, ttl=expires_at - time.time())
+        return value
+    
+    def set(self, key, value):
+        self._memory.set(key, value)
+        self._disk.set(key, value, expire=self.ttl)
+    
+    def delete(self, key):
+        self._memory.delete(key)
+        self._disk.delete(key)
+    
+    def clear(self):
+        self._memory.clear()
+        self._disk.clear()
+
+
+# Portal results shared by all scrapers (Streamlit builds a new scraper per run);
+# SCRAPER_CACHE_DIR moves the on-disk layer, e.g. to keep test runs isolated
+if diskcache is not None:
+    _SEARCH_CACHE = _DiskTTLCache(os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache'), maxsize=512, ttl=3600)
+else:
+    _SEARCH_CACHE = _TTLCache(maxsize=512, ttl=3600)
+
+
+class _SessionPool:
+    """
+    Small pool of sessions whose cookies persist in _SEARCH_CACHE between runs.
+    
+    A session that has already passed a site's bot checks keeps its cookies, so later requests skip
+    the re-challenge. Sessions are checked out exclusively (acquire blocks while all are in use) and
+    handed back with release(). Blocked sessions are replaced with fresh ones, and every session is
+    recycled after max_usage successful requests.
+    """
+    
+    def __init__(self, name: str, size: int = 4, max_usage: int = 150, verify_ssl: bool = True):
+        self.name = name
+        self.max_usage = max_usage
+        self.verify_ssl = verify_ssl
+        self._available = threading.Condition()
+        # Idle slots, least recently used first
+        self._idle = deque(range(size))
+        # [session, successful uses] per slot, built on first acquire
+        self._slots = [None] * size
+        # Checked-out session -> its slot
+        self._in_use = {}
+    
+    def _new_session(self, slot: int) -> list:
+        session = _build_session(self.verify_ssl)
+        cookies = _SEARCH_CACHE.get(('session_cookies', self.name, slot))
+        if cookies:
+            session.cookies.update(cookies)
+        return [session, 0]
+    
+    def acquire(self) -> requests.Session:
+        """Check out the least recently used idle session, waiting for one if all are in use."""
+        with self._available:
+            while not self._idle:
+                self._available.wait()
+            slot = self._idle.popleft()
+            if self._slots[slot] is None:
+                self._slots[slot] = self._new_session(slot)
+            session = self._slots[slot][0]
+            self._in_use[session] = slot
+            return session
+    
+    def release(self, session: requests.Session, ok: bool) -> None:
+        """
+        Hand a session back. ok counts a successful request and persists its cookies (recycling it
+        once worn out); otherwise it is treated as blocked and dropped along with its cookies.
+        """
+        with self._available:
+            slot = self._in_use.pop(session)
+            entry = self._slots[slot]
+            key = ('session_cookies', self.name, slot)
+            if ok:
+                entry[1] += 1
+            if ok and entry[1] < self.max_usage:
+                _SEARCH_CACHE.set(key, session.cookies.copy())
+                session = None  # stays in the slot
+            else:
+                _SEARCH_CACHE.delete(key)
+                self._slots[slot] = None
+            self._idle.append(slot)
+            self._available.notify()
+        # Only the caller held this session, so nobody else can be using it
+        if session is not None:
+            session.close()
+
+
+# LinkedIn job pages scraped at once - the session pool has one session per concurrent scrape
+_LINKEDIN_SCRAPE_CONCURRENCY = 5
+
+
+@lru_cache(maxsize=2)
+def _linkedin_session_pool(verify_ssl: bool = True) -> _SessionPool:
+    """Process-wide LinkedIn session pool, one per verify_ssl setting."""
+    return _SessionPool('linkedin', size=_LINKEDIN_SCRAPE_CONCURRENCY, verify_ssl=verify_ssl)
+
+
+def _cached_portal_search(method):
+    """
+    Cache a search_* method's results in _SEARCH_CACHE, keyed by (portal, job_title, company, options).
+    Pass force_refresh=True to bypass the cache. Empty and error-placeholder results are not cached.
+    """
+    @wraps(method)
+    def wrapper(self, job_title: str, company: str = "", *args, force_refresh: bool = False, **kwargs):
+        options = tuple(sorted((name, bool(value) if name == 'api_key' else value) for name, value in kwargs.items()))
+        key = (method.__name__, job_title.strip().lower(), company.strip().lower(), args, options)
+        
+        if not force_refresh:
+            cached = _SEARCH_CACHE.get(key)
+            if cached is not None:
+                logger.info(f"Cache hit: {method.__name__}({job_title!r}, {company!r})")
+                return list(cached)
+        
+        jobs = method(self, job_title, company, *args, **kwargs)
+        if jobs and not any(job.source in _ERROR_SOURCES for job in jobs):
+            _SEARCH_CACHE.set(key, list(jobs))
+        return jobs
+    
+    return wrapper
+
+
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str):
+    """Create (once per key) the OpenAI client; openai is only imported when AI features are used."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=1024)
+def _classify_company_cached(company: str) -> Tuple[str, bool]:
+    """Expand company abbreviations and flag government entities with a single lowercase pass."""
+    company_lower = company.strip().lower()
+    
+    expanded = _COMPANY_MAP.get(company_lower)
+    if not expanded:
+        match = _COMPANY_ABBREV_RE.search(company_lower)
+        if match:
+            expanded = _COMPANY_MAP[match.group(0)]
+    
+    if expanded:
+        # Every mapped name is a ministry or statutory board
+        return expanded, True
+    return company, _GOV_KEYWORDS_RE.search(company_lower) is not None
+
+# Browser-like request headers (read-only; requests merges per-call headers with the session's)
+_DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,  # includes br when brotli is installed
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+_LINKEDIN_HEADERS_DESKTOP = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+})
+_LINKEDIN_HEADERS_MAC = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5'
+})
+_LINKEDIN_SEARCH_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
+# Job page selectors, in priority order
+_LINKEDIN_TITLE_SELECTORS = (
+    'h1.top-card-layout__title',
+    'h2.topcard__title',
+    'h1.topcard__title',
+    'h1'
+)
+_LINKEDIN_COMPANY_SELECTORS = (
+    'a.topcard__org-name-link',
+    'span.topcard__flavor',
+    'a.sub-nav-cta__optional-url',
+    '.topcard__org-name-link'
+)
+_LINKEDIN_DESC_SELECTORS = (
+    'div.show-more-less-html__markup',
+    'div.description__text',
+    'section.description',
+    'div.core-section-container__content',
+    'article.job-details'
+)
+_CAREERS_GOV_TITLE_SELECTORS = ('h1', '.job-title', '.jobTitle', '.listing-title')
+_CAREERS_GOV_AGENCY_SELECTORS = ('.agency-name', '.company-name', '.employer')
+_CAREERS_GOV_DESC_SELECTORS = (
+    '.job-description',
+    '.description',
+    '.job-details',
+    'div[class*="description"]',
+    'div[class*="content"]'
+)
+
+
+class _SectionStrainer(SoupStrainer):
+    """
+    parse_only filter keeping tags whose class matches class_re, plus every tag named in tags
+    (a plain SoupStrainer can only require a name AND a class). Kept tags keep their full subtree.
+    """
+    
+    def __init__(self, class_re: re.Pattern, tags: Tuple[str, ...] = ()):
+        super().__init__(attrs={'class': class_re})
+        self._tags = frozenset(tags)
+    
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs) -> bool:
+        return name in self._tags or super().allow_tag_creation(nsprefix, name, attrs)
+
+
+# Only build DOM nodes for the sections we read; plain <h1> is the last-resort title selector
+_LINKEDIN_STRAINER = _SectionStrainer(re.compile(
+    r'title|topcard|top-card|description|show-more|core-section|job-details|flavor|org-name|sub-nav-cta'
+), tags=('h1',))
+_INDEED_JOB_CARD_STRAINER = SoupStrainer('div', attrs={'data-jk': True})
+_INDEED_MAX_CARDS = 3
+# Compiled once at import instead of building find() filters per card
+_INDEED_TITLE_SEL = sv.compile('h2.jobTitle')
+_INDEED_COMPANY_SEL = sv.compile('span.companyName')
+_INDEED_TITLE_LINK_SEL = sv.compile('a[href]')
+if etree is not None:
+    # Same lookups as compiled XPath, evaluated entirely inside libxml2
+    _INDEED_CARDS_XP = etree.XPath('(//div[@data-jk])[position() <= $limit]')
+    _INDEED_TITLE_XP = etree.XPath('.//h2[contains(concat(" ", normalize-space(@class), " "), " jobTitle ")][1]')
+    _INDEED_COMPANY_XP = etree.XPath('.//span[contains(concat(" ", normalize-space(@class), " "), " companyName ")][1]')
+    _INDEED_TITLE_LINK_XP = etree.XPath('boolean(.//a[@href])')
+_CAREERS_GOV_JOB_CARD_STRAINER = SoupStrainer('div', attrs={'class': re.compile(r'job', re.IGNORECASE)})
+_CAREERS_GOV_STRAINER = _SectionStrainer(re.compile(
+    r'title|agency|company|employer|description|details|content', re.IGNORECASE
+), tags=('h1',))
+
+# Search endpoints (queries are appended with urlencode)
+_CAREERS_GOV_SEARCH_URL = "https://www.careers.gov.sg/search"
+_LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search"
+_DUCKDUCKGO_SEARCH_URL = "https://html.duckduckgo.com/html/"
+
+# Portal search URL templates ({query} is filled with the quote_plus-encoded search)
+_INDEED_SEARCH_URL = "https://sg.indeed.com/jobs?q={query}&l=Singapore"
+_JOBSTREET_SEARCH_URL = "https://www.jobstreet.com.sg/jobs?keywords={query}"
+_MYCAREERSFUTURE_SEARCH_URL = "https://www.mycareersfuture.gov.sg/search?search={query}&sortBy=relevancy"
+_CAREERS_GOV_JOBS_URL = "https://jobs.careers.gov.sg/jobs?keywords={query}"
+
+# One job block in extract_job_details (fields read straight off the JobRecord)
+_JOB_DETAILS_TEMPLATE = (
+    "Job {idx}:\n"
+    "Title: {job.title}\n"
+    "Company: {job.company}\n"
+    "Description: {job.description}\n"
+    "Source: {job.source}"
+)
+
+# Portals we don't scrape: source -> (description template, search URL template or None)
+_PLACEHOLDER_PORTALS = {
+    'MyCareersFuture': (
+        "Government job portal data for {job_title} - actual API access limited in cloud deployment",
+        _MYCAREERSFUTURE_SEARCH_URL
+    ),
+    'Foundit': ("Foundit job data for {job_title} - limited access in cloud", None),
+    'JobsCentral': ("JobsCentral data for {job_title} - cloud deployment limitations", None),
+}
+
+# Sources produced when a portal request errored - transient, so never cached
+_ERROR_SOURCES = frozenset({'Indeed (Fallback)', 'JobStreet (Placeholder)', 'Careers@Gov (Limited)', 'LinkedIn (Search Limited)'})
+
+# Upper bound on waiting for any single portal in search_all_portals
+_PORTAL_TIMEOUT_SECONDS = 30
+
+# (connect, read) timeouts for portal search pages - fail fast on unreachable hosts, allow slow first bytes
+_PORTAL_REQUEST_TIMEOUT = (3, 7)
+
+# Query parameters that only track clicks/positions and never change the job page
+_TRACKING_PARAMS = frozenset({'trk', 'trkInfo', 'refId', 'trackingId', 'lipi', 'position', 'pageNum', 'originalSubdomain'})
+
+# How long career@gov may still win after LinkedIn has already answered
+_CAREERS_GOV_GRACE_SECONDS = 0.5
+
+# Job pages carry everything we read well within this many bytes
+_MAX_HTML_BYTES = 512 * 1024
+_HTML_CHUNK_SIZE = 16 * 1024
+
+# Local company-name matching in _ai_select_best_job_match (LLM is only used when ambiguous)
+_NAME_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_NAME_STOPWORDS = frozenset({'the', 'of', 'and', 'pte', 'ltd', 'limited', 'singapore', 'sg'})
+_LOCAL_MATCH_MIN_SCORE = 0.6
+_LOCAL_MATCH_MIN_MARGIN = 0.2
+
+# Structured output for _ai_select_best_job_match: {"choice": <job number> | null}
+_JOB_MATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "job_match",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"choice": {"type": ["integer", "null"]}},
+            "required": ["choice"],
+            "additionalProperties": False
         }
-        self.session.headers.update(self.headers)
-        # Disable SSL verification warnings (for environments with SSL issues)
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    }
+}
+
+# Job link predicates - compiled once, matched by BeautifulSoup without a Python callback per tag
+_CAREERS_GOV_JOB_HREF_RE = re.compile(r'/(job|listing)/')
+_LINKEDIN_JOB_HREF_RE = re.compile(r'/jobs/view/')
+# Numeric posting ID at the end of a job URL path (/jobs/view/<slug>-<id> or /jobs/view/<id>)
+_LINKEDIN_JOB_ID_RE = re.compile(r'/jobs/view/(?:[^/?#]*?-)?(\d{8,12})(?:[/?#]|$)', re.ASCII)
+_LINKEDIN_JOB_LINK_STRAINER = SoupStrainer('a', href=_LINKEDIN_JOB_HREF_RE)
+
+# Whitespace around line breaks, \r and \xa0 included (collapses blank and indented lines)
+_WS_RE = re.compile(r'[^\S\n]*\n\s*')
+
+# Embedded schema.org metadata (JobPosting) - read straight from the raw HTML
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+class JobPortalScraper:
+    """Scrapes job descriptions from job portals - Cloud compatible version."""
     
-    def _delay(self):
-        """Add random delay between requests to avoid rate limiting."""
-        time.sleep(random.uniform(1, 3))
+    def __init__(self, verify_ssl: bool = True):
+        """
+        Args:
+            verify_ssl: Verify TLS certificates (disable only for environments with intercepting proxies)
+        """
+        # Shared keep-alive session: every scraper in the process reuses the same TCP/TLS connections
+        self.session = _shared_session(verify_ssl)
+        self._linkedin_pool = _linkedin_session_pool(verify_ssl)
+        # Per-thread cache of pages/soups, active for the duration of one intelligent search
+        self._local = threading.local()
     
-    def intelligent_job_url_search(self, company: str, job_title: str, api_key: Optional[str] = None) -> Dict:
+    def intelligent_job_url_search(self, company: str, job_title: str, api_key: Optional[str] = None) -> JobRecord:
         """
         Tavily-style fast intelligent search to find actual job posting URLs.
         Prioritizes: 1) career@gov, 2) LinkedIn
@@ -48,28 +625,27 @@ class JobPortalScraper:
             api_key: OpenAI API key (for AI-enhanced extraction)
             
         Returns:
-            Dict with 'url', 'source', 'title', 'description'
+            JobRecord with url, source, title, company, description
         """
+        self._local.call_cache = {}
         try:
             logger.info(f"⚡ Fast intelligent search: {job_title} at {company}")
             
             # Expand company name
-            company_expanded = self._expand_company_name(company)
+            company_expanded, is_government = self._classify_company(company)
             
-            # STRATEGY 1: Search career@gov (government jobs - FASTEST)
-            if self._is_government_entity(company_expanded):
-                logger.info("🏛️ Searching career@gov (government portal)...")
-                careers_gov_result = self._search_careers_gov_fast(company_expanded, job_title)
-                if careers_gov_result:
-                    logger.info(f"✅ Found on career@gov: {careers_gov_result['url']}")
-                    return careers_gov_result
-            
-            # STRATEGY 2: Search LinkedIn with targeted query
-            logger.info("💼 Searching LinkedIn...")
-            linkedin_result = self._search_linkedin_fast(company_expanded, job_title, api_key)
-            if linkedin_result:
-                logger.info(f"✅ Found on LinkedIn: {linkedin_result['url']}")
-                return linkedin_result
+            if is_government:
+                # STRATEGY 1: career@gov (government jobs) raced against LinkedIn, career@gov preferred
+                logger.info("🏛️ Searching career@gov (government portal) and LinkedIn...")
+                result = self._race_careers_gov_and_linkedin(company_expanded, job_title, api_key)
+            else:
+                # STRATEGY 2: Search LinkedIn with targeted query
+                logger.info("💼 Searching LinkedIn...")
+                result = self._search_linkedin_fast(company_expanded, job_title, api_key)
+            
+            if result:
+                logger.info(f"✅ Found on {result['source']}: {result['url']}")
+                return result
             
             # FALLBACK: Return search URL
             logger.warning("⚠️ No direct job posting found - returning search URL")
@@ -78,108 +654,121 @@ class JobPortalScraper:
         except Exception as e:
             logger.error(f"Intelligent search error: {e}")
             return self._generate_fallback_search(company, job_title)
+        finally:
+            self._local.call_cache = None
+    
+    def _race_careers_gov_and_linkedin(self, company: str, job_title: str, api_key: Optional[str] = None) -> Optional[JobRecord]:
+        """
+        Search career@gov and LinkedIn concurrently and return the first valid result.
+        career@gov is preferred: if LinkedIn answers first, career@gov gets a short grace period.
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            gov_future = executor.submit(self._with_call_cache, self._search_careers_gov_fast, company, job_title)
+            linkedin_future = executor.submit(self._with_call_cache, self._search_linkedin_fast, company, job_title, api_key)
+            
+            wait([gov_future, linkedin_future], return_when=FIRST_COMPLETED)
+            if not gov_future.done():
+                wait([gov_future], timeout=_CAREERS_GOV_GRACE_SECONDS)
+            
+            if gov_future.done() and gov_future.result():
+                return gov_future.result()
+            
+            linkedin_result = linkedin_future.result()
+            if linkedin_result or gov_future.done():
+                return linkedin_result
+            return gov_future.result()
+        finally:
+            # Don't wait for the losing search - its result is discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _with_call_cache(self, func, *args):
+        """Run func on a worker thread with its own per-search page cache."""
+        self._local.call_cache = {}
+        try:
+            return func(*args)
+        finally:
+            self._local.call_cache = None
+    
+    def intelligent_job_url_search_batch(self, queries: List[Tuple[str, str]], api_key: Optional[str] = None,
+                                         concurrency: int = 8) -> List[JobRecord]:
+        """
+        Run intelligent_job_url_search for many (company, job_title) pairs with bounded concurrency.
+        
+        Args:
+            queries: List of (company, job_title) tuples
+            api_key: OpenAI API key (for AI-enhanced extraction)
+            concurrency: Maximum number of searches in flight at once
+            
+        Returns:
+            List of JobRecords (or None) in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        workers = max(1, min(concurrency, len(queries)))
+        logger.info(f"⚡ Batch search: {len(queries)} queries with concurrency {workers}")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map preserves input order
+            return list(executor.map(
+                lambda query: self.intelligent_job_url_search(query[0], query[1], api_key),
+                queries
+            ))
     
-    def _is_government_entity(self, company: str) -> bool:
-        """Check if company is a government entity."""
-        gov_keywords = ['ministry', 'government', 'statutory board', 'agency', 
-                       'authority', 'board', 'singapore armed forces', 'saf']
-        company_lower = company.lower()
-        return any(keyword in company_lower for keyword in gov_keywords)
+    def _classify_company(self, company: str) -> Tuple[str, bool]:
+        """Return (expanded company name, is government entity)."""
+        return _classify_company_cached(company)
     
-    def _search_careers_gov_fast(self, company: str, job_title: str) -> Optional[Dict]:
+    def _search_careers_gov_fast(self, company: str, job_title: str) -> Optional[JobRecord]:
         """Fast search on career@gov portal - extracts EXACT URL and FULL content."""
         try:
             # career@gov search - very fast, government jobs only
             search_query = f"{job_title} {company}".strip()
-            search_url = f"https://www.careers.gov.sg/search?search={search_query.replace(' ', '%20')}"
+            search_url = f"{_CAREERS_GOV_SEARCH_URL}?{urlencode({'search': search_query})}"
             
             logger.info(f"Searching career@gov: {search_url}")
-            response = self.session.get(search_url, timeout=5, verify=False)
+            html = self._fetch_html(search_url, timeout=5)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if html:
+                soup = self._parse_html(search_url, html)
                 
                 # Look for job listing cards - career@gov specific selectors
                 job_cards = soup.find_all('div', class_=['job-card', 'jobCard', 'listing-item'], limit=5)
-                if not job_cards:
+                if job_cards:
+                    hrefs = [link['href'] for link in (card.find('a', href=True) for card in job_cards) if link]
+                else:
                     # Fallback: look for any links with job-related href
-                    job_links = soup.find_all('a', href=lambda x: x and ('/job/' in x or '/listing/' in x), limit=5)
-                    for link in job_links:
-                        href = link.get('href', '')
-                        # Get exact full URL
-                        if href.startswith('http'):
-                            job_url = href
-                        elif href.startswith('/'):
-                            job_url = f"https://www.careers.gov.sg{href}"
-                        else:
-                            continue
-                        
-                        logger.info(f"Found job URL: {job_url}")
-                        # Scrape the actual job page for full content
-                        job_details = self._scrape_careers_gov_job(job_url, company, job_title)
-                        if job_details:
-                            return job_details
+                    hrefs = [link['href'] for link in soup.find_all('a', href=_CAREERS_GOV_JOB_HREF_RE, limit=5)]
                 
-                # If job cards found, extract from first card
-                for card in job_cards:
-                    link = card.find('a', href=True)
-                    if link:
-                        href = link.get('href', '')
-                        if href.startswith('http'):
-                            job_url = href
-                        elif href.startswith('/'):
-                            job_url = f"https://www.careers.gov.sg{href}"
-                        else:
-                            continue
-                        
-                        logger.info(f"Found job URL: {job_url}")
-                        job_details = self._scrape_careers_gov_job(job_url, company, job_title)
-                        if job_details:
-                            return job_details
+                for job_url in self._unique_job_urls(hrefs, 'https://www.careers.gov.sg'):
+                    logger.info(f"Found job URL: {job_url}")
+                    # Scrape the actual job page for full content
+                    job_details = self._scrape_careers_gov_job(job_url, company, job_title)
+                    if job_details:
+                        return job_details
             
             return None
         except Exception as e:
             logger.debug(f"career@gov search failed: {e}")
             return None
     
-    def _scrape_careers_gov_job(self, url: str, company: str, job_title: str) -> Optional[Dict]:
+    def _scrape_careers_gov_job(self, url: str, company: str, job_title: str) -> Optional[JobRecord]:
         """Scrape FULL job details from career@gov job page."""
         try:
             logger.info(f"Scraping career@gov job: {url}")
-            response = self.session.get(url, timeout=5, verify=False)
+            html = self._fetch_html(url, timeout=5)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract job title
-                title = job_title  # Default
-                title_selectors = ['h1', '.job-title', '.jobTitle', '.listing-title']
-                for selector in title_selectors:
-                    title_elem = soup.select_one(selector)
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        break
+            if html:
+                soup = self._parse_html(url, html, _CAREERS_GOV_STRAINER)
                 
-                # Extract company/agency
-                agency = company  # Default
-                agency_selectors = ['.agency-name', '.company-name', '.employer']
-                for selector in agency_selectors:
-                    agency_elem = soup.select_one(selector)
-                    if agency_elem:
-                        agency = agency_elem.get_text(strip=True)
-                        break
+                # Extract job title and company/agency
+                title = self._select_first_text(soup, _CAREERS_GOV_TITLE_SELECTORS)
+                agency = self._select_first_text(soup, _CAREERS_GOV_AGENCY_SELECTORS) or company
                 
                 # Extract FULL job description
                 description = ""
-                desc_selectors = [
-                    '.job-description',
-                    '.description',
-                    '.job-details',
-                    'div[class*="description"]',
-                    'div[class*="content"]'
-                ]
-                
-                for selector in desc_selectors:
+                for selector in _CAREERS_GOV_DESC_SELECTORS:
                     desc_elem = soup.select_one(selector)
                     if desc_elem:
                         # Get full text content
@@ -187,57 +776,198 @@ class JobPortalScraper:
                         if len(description) > 100:  # Valid description
                             break
                 
-                # If still no description, get main content
+                # If still no description, parse the full page and get main content
                 if not description or len(description) < 100:
-                    main_content = soup.find('main') or soup.find('article') or soup.find('body')
+                    full_soup = self._parse_html(url, html)
+                    title = title or self._select_first_text(full_soup, ['h1'])
+                    main_content = full_soup.find('main') or full_soup.find('article') or full_soup.find('body')
                     if main_content:
                         description = main_content.get_text(separator='\n', strip=True)
                 
+                title = title or job_title
                 logger.info(f"✅ Extracted {len(description)} chars from career@gov")
                 
-                return {
-                    'url': url,  # EXACT full URL
-                    'source': 'career@gov',
-                    'title': title,
-                    'company': agency,
-                    'description': description
-                }
+                return JobRecord(
+                    url=url,  # EXACT full URL
+                    source='career@gov',
+                    title=title,
+                    company=agency,
+                    description=description
+                )
             
             return None
         except Exception as e:
             logger.error(f"Failed to scrape career@gov job: {e}")
             return None
     
-    def _search_linkedin_fast(self, company: str, job_title: str, api_key: Optional[str] = None) -> Optional[Dict]:
-        """Fast targeted LinkedIn search with AI company matching."""
-        try:
-            # Single fast search query
-            search_query = f"{job_title} {company}".strip().replace(' ', '%20')
-            search_url = f"https://www.linkedin.com/jobs/search?keywords={search_query}&location=Singapore"
+    def _fetch_html(self, url: str, timeout: int = 5) -> Optional[bytes]:
+        """
+        Fetch an HTML page, streaming at most _MAX_HTML_BYTES of the body.
+        Pages are fetched once per intelligent search.
+        
+        Returns:
+            Raw (possibly truncated) page bytes, or None for non-200 / non-HTML responses
+        """
+        call_cache = getattr(self._local, 'call_cache', None)
+        if call_cache is not None and ('html', url) in call_cache:
+            return call_cache[('html', url)]
+        
+        html = self._stream_html(url, timeout)
+        if call_cache is not None:
+            call_cache[('html', url)] = html
+        return html
+    
+    def _parse_html(self, url: str, html: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a fetched page, reusing the tree if the same page/strainer was parsed during this search."""
+        call_cache = getattr(self._local, 'call_cache', None)
+        key = ('soup', url, id(parse_only))  # strainers are module-level constants
+        if call_cache is not None and key in call_cache:
+            return call_cache[key]
+        
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+        if call_cache is not None:
+            call_cache[key] = soup
+        return soup
+    
+    def _stream_html(self, url: str, timeout: Union[float, Tuple[float, float]], headers: Optional[Dict] = None,
+                     stop_marker: Optional[bytes] = None, stop_count: int = 1,
+                     session: Optional[requests.Session] = None) -> Optional[bytes]:
+        """
+        Stream a page body up to _MAX_HTML_BYTES (see _fetch_html).
+        
+        With stop_marker, the download also stops (and the connection is released) as soon as the
+        marker has appeared stop_count times - callers that only read the first few items of a
+        long page never receive the rest. session overrides the scraper's shared session.
+        """
+        with (session or self.session).get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True) as response:
+            if response.status_code != 200:
+                logger.debug(f"HTTP {response.status_code}: {url}")
+                return None
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-            }
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type:
+                logger.debug(f"Skipping non-HTML response ({content_type}): {url}")
+                return None
             
-            response = requests.get(search_url, headers=headers, timeout=3, verify=False)
+            body = bytearray()
+            markers_seen = 0
+            for chunk in response.iter_content(_HTML_CHUNK_SIZE):
+                # Resume the marker scan just before the new chunk so a marker split across chunks is found once
+                scan_from = max(0, len(body) - len(stop_marker) + 1) if stop_marker else 0
+                body.extend(chunk)
+                if stop_marker:
+                    markers_seen += body.count(stop_marker, scan_from)
+                    if markers_seen >= stop_count:
+                        break
+                if len(body) >= _MAX_HTML_BYTES:
+                    logger.debug(f"Truncated page at {_MAX_HTML_BYTES} bytes: {url}")
+                    break
+            return bytes(body)
+    
+    def _unique_job_urls(self, hrefs: List[str], base_url: str) -> List[str]:
+        """Absolute, canonical job URLs with duplicates removed (first occurrence order kept)."""
+        urls = []
+        for href in hrefs:
+            if href.startswith('/'):
+                href = base_url + href
+            elif not href.startswith('http'):
+                continue
+            urls.append(_canonicalize_url(href))
+        return list(dict.fromkeys(urls))
+    
+    def _select_first_text(self, soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
+        """Return the stripped text of the first element matching any of the CSS selectors."""
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                return elem.get_text(strip=True)
+        return None
+    
+    def _extract_job_postings(self, html: str, default_url: Optional[str] = None) -> List[JobRecord]:
+        """
+        Extract schema.org JobPosting entries from JSON-LD blocks in a page.
+        
+        Args:
+            html: Raw page HTML
+            default_url: URL to use when a posting does not declare its own
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+        Returns:
+            List of JobRecords
+        """
+        postings = []
+        for block in _JSON_LD_RE.findall(html):
+            try:
+                data = _json_loads(block.strip())
+            except ValueError:
+                continue
+            
+            # Flatten lists, @graph containers and ItemList entries
+            nodes = data if isinstance(data, list) else [data]
+            while nodes:
+                node = nodes.pop(0)
+                if not isinstance(node, dict):
+                    continue
+                nodes.extend(node.get('@graph', []))
+                nodes.extend(item.get('item', item) for item in node.get('itemListElement', []) if isinstance(item, dict))
                 
-                # Find multiple job links for AI filtering
-                job_links = soup.find_all('a', href=lambda x: x and '/jobs/view/' in x, limit=5)
+                if node.get('@type') != 'JobPosting':
+                    continue
+                
+                url = (node.get('url') or default_url or '').split('?')[0]
+                description = node.get('description') or ''
+                if not url or not description:
+                    continue
                 
-                if job_links and api_key:
-                    logger.info(f"Found {len(job_links)} jobs - using AI to match company")
+                organization = node.get('hiringOrganization')
+                company = organization.get('name') if isinstance(organization, dict) else organization
+                postings.append(JobRecord(
+                    url=url,
+                    source='LinkedIn',
+                    title=node.get('title') or 'Job posting',
+                    company=company or 'Company',
+                    # JSON-LD descriptions are (often entity-escaped) HTML fragments
+                    description=BeautifulSoup(unescape(description), _HTML_PARSER).get_text(separator='\n', strip=True)
+                ))
+        
+        return postings
+    
+    def _search_linkedin_fast(self, company: str, job_title: str, api_key: Optional[str] = None) -> Optional[JobRecord]:
+        """Fast targeted LinkedIn search with AI company matching."""
+        try:
+            # Single fast search query
+            search_query = f"{job_title} {company}".strip()
+            search_url = f"{_LINKEDIN_SEARCH_URL}?{urlencode({'keywords': search_query, 'location': 'Singapore'})}"
+            
+            html = self._fetch_html(search_url, timeout=3)
+            
+            if html:
+                # Search pages can embed JobPosting JSON-LD - use it to skip the detail-page round-trips
+                postings = self._extract_job_postings(html.decode('utf-8', errors='replace'))[:5]
+                if postings:
+                    logger.info(f"Found {len(postings)} jobs in search page metadata")
+                    if not api_key:
+                        logger.warning("No API key - taking first result without company verification")
+                        return postings[0]
+                    
+                    best_match = self._ai_select_best_job_match(
+                        postings, company, self._expand_company_name(company), job_title, api_key
+                    )
+                    if not best_match:
+                        logger.warning(f"AI rejected all jobs - none match {company}")
+                    return best_match
+                
+                soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_LINKEDIN_JOB_LINK_STRAINER)
+                
+                # Find multiple job links for AI filtering (one entry per distinct job)
+                job_links = soup.find_all('a', href=_LINKEDIN_JOB_HREF_RE, limit=5)
+                job_urls = self._unique_job_urls([link['href'] for link in job_links], 'https://www.linkedin.com')
+                
+                if job_urls and api_key:
+                    logger.info(f"Found {len(job_urls)} jobs - using AI to match company")
                     
                     # Scrape all found jobs
                     potential_jobs = []
-                    for link in job_links:
-                        job_url = link['href']
-                        if not job_url.startswith('http'):
-                            job_url = 'https://www.linkedin.com' + job_url
-                        
+                    for job_url in job_urls:
                         job_data = self._scrape_linkedin_fast(job_url)
                         if job_data:
                             potential_jobs.append(job_data)
@@ -253,14 +983,10 @@ class JobPortalScraper:
                             logger.warning(f"AI rejected all jobs - none match {company}")
                             return None
                 
-                elif job_links:
+                elif job_urls:
                     # No API key - just take first result (risky!)
                     logger.warning("No API key - taking first result without company verification")
-                    job_url = job_links[0]['href']
-                    if not job_url.startswith('http'):
-                        job_url = 'https://www.linkedin.com' + job_url
-                    
-                    job_data = self._scrape_linkedin_fast(job_url)
+                    job_data = self._scrape_linkedin_fast(job_urls[0])
                     if job_data:
                         return job_data
             
@@ -269,7 +995,7 @@ class JobPortalScraper:
             logger.debug(f"LinkedIn fast search failed: {e}")
             return None
     
-    def _scrape_linkedin_fast(self, url: str) -> Optional[Dict]:
+    def _scrape_linkedin_fast(self, url: str) -> Optional[JobRecord]:
         """Scrape FULL job details from LinkedIn job page."""
         try:
             logger.info(f"Scraping LinkedIn job: {url}")
@@ -277,65 +1003,32 @@ class JobPortalScraper:
             # Clean URL - remove tracking parameters for cleaner URL
             clean_url = url.split('?')[0] if '?' in url else url
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=5, verify=False, allow_redirects=True)
+            html = self._fetch_html(url, timeout=5)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if html:
+                # Prefer the embedded JobPosting JSON-LD over class-name selectors
+                postings = self._extract_job_postings(html.decode('utf-8', errors='replace'), default_url=clean_url)
+                if postings:
+                    logger.info(f"✅ Extracted {len(postings[0]['description'])} chars from LinkedIn JSON-LD")
+                    return postings[0]
                 
-                # Extract title - multiple selectors
-                title = None
-                title_selectors = [
-                    'h1.top-card-layout__title',
-                    'h2.topcard__title',
-                    'h1.topcard__title',
-                    'h1'
-                ]
-                for selector in title_selectors:
-                    title_elem = soup.select_one(selector)
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        break
+                soup = self._parse_html(url, html, _LINKEDIN_STRAINER)
                 
-                # Extract company - multiple selectors
-                company = None
-                company_selectors = [
-                    'a.topcard__org-name-link',
-                    'span.topcard__flavor',
-                    'a.sub-nav-cta__optional-url',
-                    '.topcard__org-name-link'
-                ]
-                for selector in company_selectors:
-                    company_elem = soup.select_one(selector)
-                    if company_elem:
-                        company = company_elem.get_text(strip=True)
-                        break
+                # Extract title and company - multiple selectors
+                title = self._select_first_text(soup, _LINKEDIN_TITLE_SELECTORS)
+                company = self._select_first_text(soup, _LINKEDIN_COMPANY_SELECTORS)
                 
                 # Extract FULL description - not just 500 chars!
                 description = ""
-                desc_selectors = [
-                    'div.show-more-less-html__markup',
-                    'div.description__text',
-                    'section.description',
-                    'div.core-section-container__content',
-                    'article.job-details'
-                ]
-                
-                for selector in desc_selectors:
+                for selector in _LINKEDIN_DESC_SELECTORS:
                     desc_elem = soup.select_one(selector)
                     if desc_elem:
                         # Get FULL text with proper formatting
                         description = desc_elem.get_text(separator='\n', strip=True)
                         if len(description) > 100:  # Valid description
                             break
-                
-                # If no description found, try broader search
-                if not description or len(description) < 100:
+                else:
+                    # Primary selectors found nothing usable - try broader search
                     # Look for any div with substantial text content
                     content_divs = soup.find_all('div', class_=lambda x: x and 'description' in x.lower())
                     for div in content_divs:
@@ -346,78 +1039,42 @@ class JobPortalScraper:
                 logger.info(f"✅ Extracted {len(description)} chars from LinkedIn")
                 
                 if title or description:
-                    return {
-                        'url': clean_url,  # EXACT clean URL
-                        'source': 'LinkedIn',
-                        'title': title or 'Job posting',
-                        'company': company or 'Company',
-                        'description': description or 'LinkedIn job posting'
-                    }
+                    return JobRecord(
+                        url=clean_url,  # EXACT clean URL
+                        source='LinkedIn',
+                        title=title or 'Job posting',
+                        company=company or 'Company',
+                        description=description or 'LinkedIn job posting'
+                    )
             
             return None
         except Exception as e:
             logger.debug(f"LinkedIn scrape failed: {e}")
             return None
     
-    def _generate_fallback_search(self, company: str, job_title: str) -> Dict:
+    def _generate_fallback_search(self, company: str, job_title: str) -> JobRecord:
         """Generate fallback with search URLs."""
         # Try career@gov first for government
-        if self._is_government_entity(company):
-            search_query = f"{job_title} {company}".replace(' ', '%20')
-            url = f"https://www.careers.gov.sg/search?search={search_query}"
+        search_query = f"{job_title} {company}"
+        _, is_government = self._classify_company(company)
+        if is_government:
+            url = f"{_CAREERS_GOV_SEARCH_URL}?{urlencode({'search': search_query})}"
             source = 'career@gov (search)'
         else:
-            search_query = f"{job_title} {company}".replace(' ', '%20')
-            url = f"https://www.linkedin.com/jobs/search?keywords={search_query}&location=Singapore"
+            url = f"{_LINKEDIN_SEARCH_URL}?{urlencode({'keywords': search_query, 'location': 'Singapore'})}"
             source = 'LinkedIn (search)'
         
-        return {
-            'url': url,
-            'source': source,
-            'title': job_title,
-            'company': company,
-            'description': f"Search results for {job_title} at {company}. Click the link to browse available positions."
-        }
+        return JobRecord(
+            url=url,
+            source=source,
+            title=job_title,
+            company=company,
+            description=f"Search results for {job_title} at {company}. Click the link to browse available positions."
+        )
     
     def _expand_company_name(self, company: str) -> str:
         """Expand company abbreviations for better search results."""
-        company_lower = company.lower()
-        
-        # Government ministries
-        if 'mindef' in company_lower or company_lower == 'mod':
-            return "Ministry of Defence Singapore"
-        elif 'moe' in company_lower:
-            return "Ministry of Education Singapore"
-        elif 'moh' in company_lower:
-            return "Ministry of Health Singapore"
-        elif 'mom' in company_lower:
-            return "Ministry of Manpower Singapore"
-        elif 'mfa' in company_lower:
-            return "Ministry of Foreign Affairs Singapore"
-        elif 'mha' in company_lower:
-            return "Ministry of Home Affairs Singapore"
-        elif 'mtc' in company_lower or 'mci' in company_lower:
-            return "Ministry of Communications and Information Singapore"
-        elif 'mnd' in company_lower:
-            return "Ministry of National Development Singapore"
-        elif 'mof' in company_lower:
-            return "Ministry of Finance Singapore"
-        elif 'mti' in company_lower:
-            return "Ministry of Trade and Industry Singapore"
-        
-        # Statutory boards
-        elif 'iras' in company_lower:
-            return "Inland Revenue Authority of Singapore"
-        elif 'cpf' in company_lower:
-            return "Central Provident Fund Board Singapore"
-        elif 'hdb' in company_lower:
-            return "Housing Development Board Singapore"
-        elif 'lta' in company_lower:
-            return "Land Transport Authority Singapore"
-        elif 'nea' in company_lower:
-            return "National Environment Agency Singapore"
-        
-        return company
+        return _classify_company_cached(company)[0]
     
     def _ai_analyze_web_results(self, results: List[str], company: str, job_title: str, api_key: str) -> str:
         """
@@ -433,8 +1090,7 @@ class JobPortalScraper:
             AI-generated summary of key job responsibilities and context
         """
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             results_text = "\n\n".join(results)
             
@@ -456,7 +1112,7 @@ Focus on factual information found in the search results."""
                     {"role": "system", "content": "You are a research analyst extracting key job information from web sources."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=300,
+                max_completion_tokens=200,  # ~150 words
                 temperature=0.3
             )
             
@@ -469,70 +1125,68 @@ Focus on factual information found in the search results."""
             # Return raw results as fallback
             return "\n\n".join(results[:3])
     
-    def ai_search_linkedin_url(self, company: str, job_title: str, api_key: Optional[str] = None) -> Optional[str]:
+    def ai_search_linkedin_url(self, company: str, job_title: str, api_key: Optional[str] = None,
+                               force_refresh: bool = False) -> Optional[str]:
         """
         Use AI to intelligently search for LinkedIn job URL.
-        Fast search with timeout limits.
+        Fast search with timeout limits; URLs found are cached per (company, job_title) for an hour.
         
         Args:
             company: Company name
             job_title: Job title
             api_key: OpenAI API key (optional, for enhanced search)
+            force_refresh: Ignore any cached URL and search again
             
         Returns:
             LinkedIn job URL if found, None otherwise
         """
+        key = ('ai_search_linkedin_url', company.strip().lower(), job_title.strip().lower())
+        if not force_refresh:
+            cached = _SEARCH_CACHE.get(key)
+            if cached is not None:
+                logger.info(f"Cache hit: LinkedIn URL search for {job_title!r} at {company!r}")
+                return cached
+        
+        job_url = self._ai_search_linkedin_url_uncached(company, job_title, api_key)
+        if job_url:
+            _SEARCH_CACHE.set(key, job_url)
+        return job_url
+    
+    def _ai_search_linkedin_url_uncached(self, company: str, job_title: str, api_key: Optional[str] = None) -> Optional[str]:
+        """Run the web search for a LinkedIn job URL (see ai_search_linkedin_url)."""
         try:
             logger.info(f"🔍 Quick AI search for LinkedIn job...")
             
             # Expand company names for better search
-            company_expanded = company
-            company_lower = company.lower()
-            if 'mindef' in company_lower or company_lower == 'mod':
-                company_expanded = "Ministry of Defence Singapore"
-            elif 'moe' in company_lower:
-                company_expanded = "Ministry of Education Singapore"
-            elif 'moh' in company_lower:
-                company_expanded = "Ministry of Health Singapore"
-            elif 'mom' in company_lower:
-                company_expanded = "Ministry of Manpower Singapore"
+            company_expanded = self._expand_company_name(company)
             
             # Use only the best search query (don't try multiple)
             query = f'site:linkedin.com/jobs/view "{job_title}" "{company_expanded}"'
-            search_url = f"https://html.duckduckgo.com/html/?q={query.replace(' ', '+')}"
+            search_url = f"{_DUCKDUCKGO_SEARCH_URL}?{urlencode({'q': query})}"
             
             try:
                 # Quick search with short timeout
-                response = self.session.get(search_url, timeout=3, verify=False)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                html = self._stream_html(search_url, 3)
+                if html:
+                    soup = BeautifulSoup(html, _HTML_PARSER)
                     
                     # Look for first LinkedIn job URL only
                     links = soup.find_all('a', href=True, limit=20)  # Limit to first 20 links
                     for link in links:
-                        href = link.get('href', '')
+                        href = link['href']
+                        
+                        # DuckDuckGo redirect links carry the (percent-encoded) target in ?uddg=
+                        parts = urlsplit(href if href.startswith(('http', '//')) else 'https://duckduckgo.com' + href)
+                        job_url = parse_qs(parts.query).get('uddg', [href])[0]
                         
-                        # Check if this is a LinkedIn job URL
-                        if 'linkedin.com/jobs/view' in href:
-                            # Extract the actual LinkedIn URL
-                            if href.startswith('//duckduckgo.com'):
-                                # DuckDuckGo redirect link - extract actual URL
-                                import urllib.parse
-                                try:
-                                    parsed = urllib.parse.parse_qs(href)
-                                    if 'uddg' in parsed:
-                                        actual_url = urllib.parse.unquote(parsed['uddg'][0])
-                                        if 'linkedin.com/jobs/view' in actual_url:
-                                            logger.info(f"✅ Found LinkedIn URL via AI search")
-                                            return actual_url
-                                except:
-                                    continue
-                            elif 'linkedin.com/jobs/view' in href:
-                                # Direct LinkedIn URL
-                                if not href.startswith('http'):
-                                    href = 'https://www.linkedin.com' + href
-                                logger.info(f"✅ Found LinkedIn URL via AI search")
-                                return href
+                        # Check if this is a LinkedIn job posting URL
+                        if 'linkedin.com/' in job_url and _linkedin_job_id(job_url):
+                            if job_url.startswith('//'):
+                                job_url = 'https:' + job_url
+                            elif not job_url.startswith('http'):
+                                job_url = 'https://www.linkedin.com' + job_url
+                            logger.info(f"✅ Found LinkedIn URL via AI search")
+                            return _canonicalize_url(job_url)
                 
             except Exception as e:
                 logger.debug(f"Quick search timed out: {e}")
@@ -544,32 +1198,45 @@ Focus on factual information found in the search results."""
             logger.debug(f"AI search error: {e}")
             return None
     
-    def _ai_select_best_job_match(self, jobs: List[Dict], target_company: str, company_expanded: str, job_title: str, api_key: str) -> Optional[Dict]:
+    def _ai_select_best_job_match(self, jobs: List[JobRecord], target_company: str, company_expanded: str, job_title: str, api_key: str) -> Optional[JobRecord]:
         """
         Use AI to intelligently select the best matching job from search results.
         
         Args:
-            jobs: List of scraped job dictionaries
+            jobs: List of scraped JobRecords
             target_company: Original company name from user (e.g., "Mindef")
             company_expanded: Expanded company name (e.g., "Ministry of Defence Singapore")
             job_title: Job title being searched for
             api_key: OpenAI API key
             
         Returns:
-            Best matching job dictionary or None
+            Best matching JobRecord or None
         """
         try:
             if not api_key:
                 logger.warning("No API key provided for AI filtering")
                 return jobs[0] if jobs else None
             
+            # Fast path: pick locally when exactly one company name clearly matches the target
+            target_tokens = [_name_tokens(target_company), _name_tokens(company_expanded)]
+            scores = sorted(
+                ((_company_similarity(target_tokens, job.company), idx) for idx, job in enumerate(jobs)),
+                reverse=True
+            )
+            if scores:
+                best_score, best_idx = scores[0]
+                runner_up = scores[1][0] if len(scores) > 1 else 0.0
+                if best_score >= _LOCAL_MATCH_MIN_SCORE and best_score - runner_up >= _LOCAL_MATCH_MIN_MARGIN:
+                    logger.info(f"✅ Local match selected job {best_idx+1} for {target_company} (score {best_score:.2f})")
+                    return jobs[best_idx]
+            
             # Prepare job summaries for AI analysis
             job_summaries = []
             for idx, job in enumerate(jobs):
                 summary = f"Job {idx+1}:\n"
-                summary += f"  Company: {job.get('company', 'Unknown')}\n"
-                summary += f"  Title: {job.get('title', 'Unknown')}\n"
-                summary += f"  Description: {job.get('description', 'No description')[:200]}...\n"
+                summary += f"  Company: {job.company}\n"
+                summary += f"  Title: {job.title}\n"
+                summary += f"  Description: {job.description[:200]}...\n"
                 job_summaries.append(summary)
             
             # AI prompt for intelligent matching
@@ -589,243 +1256,257 @@ INSTRUCTIONS:
 3. IMPORTANT: Reject jobs from completely unrelated companies (e.g., LEGO, Netflix when searching for Ministry of Defence)
 4. Consider name variations (Mindef = Ministry of Defence = Singapore Armed Forces)
 
-Respond with ONLY the job number (1, 2, 3, etc.) of the best match.
-If NO jobs match the target company at all, respond with "NONE".
-
-Your response (just the number or NONE):"""
+Set "choice" to the job number (1, 2, 3, etc.) of the best match.
+If NO jobs match the target company at all, set "choice" to null."""
 
             # Call OpenAI
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a precise job matching assistant. Return only job numbers or 'NONE'."},
+                    {"role": "system", "content": "You are a precise job matching assistant. Return only the selected job number."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=10,
+                response_format=_JOB_MATCH_RESPONSE_FORMAT,
+                max_completion_tokens=20,
                 temperature=0
             )
             
-            result = response.choices[0].message.content.strip().upper()
+            result = response.choices[0].message.content
             logger.info(f"AI job selection result: {result}")
             
-            # Parse AI response
-            if result == "NONE":
+            # Parse AI response - {"choice": <job number> | null}
+            choice = _json_loads(result)['choice']
+            if choice is None:
                 logger.warning(f"AI determined none of the jobs match {target_company}")
                 return None
             
-            # Extract job number
-            import re
-            match = re.search(r'\d+', result)
-            if match:
-                job_num = int(match.group()) - 1  # Convert to 0-indexed
-                if 0 <= job_num < len(jobs):
-                    logger.info(f"✅ AI selected job {job_num+1} as best match for {target_company}")
-                    return jobs[job_num]
-            
-            # Fallback: return first job if AI response unclear
-            logger.warning("Could not parse AI response, using first job")
+            job_num = int(choice) - 1  # Convert to 0-indexed
+            if 0 <= job_num < len(jobs):
+                logger.info(f"✅ AI selected job {job_num+1} as best match for {target_company}")
+                return jobs[job_num]
+            
+            # Fallback: return first job if AI choice is out of range
+            logger.warning("AI choice out of range, using first job")
             return jobs[0]
             
         except Exception as e:
             logger.error(f"AI job filtering error: {e}")
             return jobs[0] if jobs else None
     
-    def search_indeed(self, job_title: str, company: str = "") -> List[Dict]:
-        """Search Indeed jobs with basic HTTP requests (cloud-friendly)."""
+    @_cached_portal_search
+    def search_indeed(self, job_title: str, company: str = "", limit: int = _INDEED_MAX_CARDS) -> List[JobRecord]:
+        """Search Indeed jobs with basic HTTP requests (cloud-friendly), reading at most `limit` cards."""
         jobs = []
         try:
             search_query = f"{job_title} {company}".strip()
-            url = f"https://sg.indeed.com/jobs?q={search_query.replace(' ', '+')}&l=Singapore"
+            url = _INDEED_SEARCH_URL.format(query=quote_plus(search_query))
             
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
+            # Stop downloading once the card after the last one we read starts - the earlier cards are complete
+            html = self._stream_html(url, _PORTAL_REQUEST_TIMEOUT, stop_marker=b'data-jk=', stop_count=limit + 1)
+            if html:
                 # Basic parsing for Indeed (may be limited due to anti-bot measures)
-                job_cards = soup.find_all('div', {'data-jk': True})[:3]  # Limit to 3 results
-                
-                for card in job_cards:
-                    try:
-                        title_elem = card.find('h2', {'class': 'jobTitle'})
-                        company_elem = card.find('span', {'class': 'companyName'})
-                        
-                        # Extract job URL
-                        job_url = None
-                        link_elem = title_elem.find('a', href=True) if title_elem else None
-                        if link_elem:
-                            job_id = card.get('data-jk', '')
-                            if job_id:
-                                job_url = f"https://sg.indeed.com/viewjob?jk={job_id}"
-                        
-                        if title_elem and company_elem:
-                            job_data = {
-                                'title': title_elem.get_text(strip=True),
-                                'company': company_elem.get_text(strip=True),
-                                'description': f"Job posting from Indeed for {job_title}",
-                                'source': 'Indeed'
-                            }
-                            if job_url:
-                                job_data['url'] = job_url
-                            jobs.append(job_data)
-                    except Exception as e:
-                        logger.debug(f"Error parsing Indeed job card: {e}")
-                        continue
+                for title, company_name, job_id in self._parse_indeed_cards(html, limit):
+                    jobs.append(JobRecord(
+                        title=title,
+                        company=company_name,
+                        description=f"Job posting from Indeed for {job_title}",
+                        source='Indeed',
+                        url=f"https://sg.indeed.com/viewjob?jk={job_id}" if job_id else None
+                    ))
             
             # If no results found, add placeholder
             if not jobs:
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Company',
-                    'description': 'Indeed search results limited in cloud deployment',
-                    'source': 'Indeed (Limited)',
-                    'url': url  # Include search URL as reference
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Company',
+                    description='Indeed search results limited in cloud deployment',
+                    source='Indeed (Limited)',
+                    url=url  # Include search URL as reference
+                ))
                 
         except Exception as e:
             logger.warning(f"Indeed search error: {e}")
             # Add fallback data
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': 'Indeed unavailable - using fallback data',
-                'source': 'Indeed (Fallback)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description='Indeed unavailable - using fallback data',
+                source='Indeed (Fallback)'
+            ))
         
         return jobs
     
-    def search_jobstreet(self, job_title: str, company: str = "") -> List[Dict]:
+    def _parse_indeed_cards(self, html: bytes, limit: int = _INDEED_MAX_CARDS) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Extract (title, company, job id) from the first Indeed result cards.
+        
+        Uses selectolax when installed, then lxml XPath, and BeautifulSoup restricted to the job
+        cards as a last resort.
+        The job id is only returned for cards whose title links to the posting.
+        """
+        cards = []
+        if HTMLParser is not None:
+            for card in HTMLParser(html).css('div[data-jk]')[:limit]:
+                title_elem = card.css_first('h2.jobTitle')
+                company_elem = card.css_first('span.companyName')
+                if title_elem and company_elem:
+                    has_link = title_elem.css_first('a[href]') is not None
+                    cards.append((
+                        title_elem.text(strip=True),
+                        company_elem.text(strip=True),
+                        card.attributes.get('data-jk') if has_link else None
+                    ))
+            return cards
+        
+        if lxml_html is not None:
+            for card in _INDEED_CARDS_XP(lxml_html.fromstring(html), limit=limit):
+                title_elem = _INDEED_TITLE_XP(card)
+                company_elem = _INDEED_COMPANY_XP(card)
+                if title_elem and company_elem:
+                    cards.append((
+                        ''.join(text.strip() for text in title_elem[0].itertext()),
+                        ''.join(text.strip() for text in company_elem[0].itertext()),
+                        card.get('data-jk') if _INDEED_TITLE_LINK_XP(title_elem[0]) else None
+                    ))
+            return cards
+        
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_INDEED_JOB_CARD_STRAINER)
+        # The strained tree holds only the job cards, so they are all top-level
+        for card in soup.find_all('div', recursive=False, limit=limit):
+            # Selector misses return None - plain guards, no per-card exception handling
+            title_elem = _INDEED_TITLE_SEL.select_one(card)
+            company_elem = _INDEED_COMPANY_SEL.select_one(card)
+            if title_elem and company_elem:
+                has_link = _INDEED_TITLE_LINK_SEL.select_one(title_elem) is not None
+                cards.append((
+                    title_elem.get_text(strip=True),
+                    company_elem.get_text(strip=True),
+                    card.get('data-jk') if has_link else None
+                ))
+        return cards
+    
+    @_cached_portal_search
+    def search_jobstreet(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search JobStreet (simplified for cloud deployment)."""
         jobs = []
         try:
             # JobStreet Singapore search
             search_query = f"{job_title} {company}".strip()
-            url = f"https://www.jobstreet.com.sg/jobs?keywords={search_query.replace(' ', '%20')}"
+            url = _JOBSTREET_SEARCH_URL.format(query=quote_plus(search_query))
             
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
+            # Only the status matters here - the body is never read
+            with self.session.get(url, timeout=_PORTAL_REQUEST_TIMEOUT, stream=True) as response:
+                status_code = response.status_code
+            if status_code == 200:
                 # Add basic job data (actual scraping may be limited) with search URL
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Company',
-                    'description': f"JobStreet posting for {job_title} - web scraping limited in cloud",
-                    'source': 'JobStreet',
-                    'url': url  # Include search URL
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Company',
+                    description=f"JobStreet posting for {job_title} - web scraping limited in cloud",
+                    source='JobStreet',
+                    url=url  # Include search URL
+                ))
         
         except Exception as e:
             logger.warning(f"JobStreet search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company', 
-                'description': 'JobStreet unavailable - using placeholder data',
-                'source': 'JobStreet (Placeholder)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company', 
+                description='JobStreet unavailable - using placeholder data',
+                source='JobStreet (Placeholder)'
+            ))
         
         return jobs
     
-    def search_mycareersfuture(self, job_title: str, company: str = "") -> List[Dict]:
-        """Search MyCareersFuture (government job portal)."""
-        jobs = []
-        try:
-            # MyCareersFuture search URL
-            search_query = f"{job_title} {company}".strip()
-            url = f"https://www.mycareersfuture.gov.sg/search?search={search_query.replace(' ', '%20')}&sortBy=relevancy"
-            
-            # MyCareersFuture API approach (simplified)
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"Government job portal data for {job_title} - actual API access limited in cloud deployment",
-                'source': 'MyCareersFuture',
-                'url': url  # Include search URL
-            })
-            
-        except Exception as e:
-            logger.warning(f"MyCareersFuture search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': 'MyCareersFuture placeholder data',
-                'source': 'MyCareersFuture (Placeholder)'
-            })
-        
-        return jobs
+    def search_mycareersfuture(self, job_title: str, company: str = "") -> List[JobRecord]:
+        """MyCareersFuture (government job portal) - search link only, no request is made."""
+        return [self._placeholder_job('MyCareersFuture', job_title, company)]
     
-    def search_careers_gov_sg(self, job_title: str, company: str = "") -> List[Dict]:
+    @_cached_portal_search
+    def search_careers_gov_sg(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search Careers@Gov (Singapore government careers portal)."""
         jobs = []
         try:
             # Careers@Gov portal search
             search_query = f"{job_title} {company}".strip()
-            url = f"https://jobs.careers.gov.sg/jobs?keywords={search_query.replace(' ', '%20')}"
+            url = _CAREERS_GOV_JOBS_URL.format(query=quote_plus(search_query))
             
-            response = self.session.get(url, timeout=10, verify=False)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            html = self._stream_html(url, _PORTAL_REQUEST_TIMEOUT)
+            if html:
+                soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_CAREERS_GOV_JOB_CARD_STRAINER)
                 
                 # Try to parse job listings from Careers@Gov
-                job_cards = soup.find_all('div', {'class': lambda x: x and 'job' in str(x).lower()})[:2]
+                job_cards = soup.select('div[class*="job" i]', limit=2)
                 
                 if job_cards:
                     for card in job_cards:
-                        try:
-                            title_elem = card.find(['h2', 'h3', 'h4'])
-                            # Try to find job URL within the card
-                            job_url = None
-                            link_elem = card.find('a', href=True)
-                            if link_elem:
-                                job_url = link_elem['href']
-                                if not job_url.startswith('http'):
-                                    job_url = 'https://jobs.careers.gov.sg' + job_url
-                            
-                            if title_elem:
-                                job_data = {
-                                    'title': title_elem.get_text(strip=True),
-                                    'company': company or 'Government Agency',
-                                    'description': f"Government sector job posting for {job_title}",
-                                    'source': 'Careers@Gov'
-                                }
-                                if job_url:
-                                    job_data['url'] = job_url
-                                jobs.append(job_data)
-                        except Exception as e:
-                            logger.debug(f"Error parsing Careers@Gov job card: {e}")
-                            continue
+                        title_elem = card.find(['h2', 'h3', 'h4'])
+                        # Try to find job URL within the card
+                        job_url = None
+                        link_elem = card.find('a', href=True)
+                        if link_elem:
+                            job_url = link_elem['href']
+                            if not job_url.startswith('http'):
+                                job_url = 'https://jobs.careers.gov.sg' + job_url
+                        
+                        if title_elem:
+                            jobs.append(JobRecord(
+                                title=title_elem.get_text(strip=True),
+                                company=company or 'Government Agency',
+                                description=f"Government sector job posting for {job_title}",
+                                source='Careers@Gov',
+                                url=job_url
+                            ))
             
             # If no results found, add placeholder with search URL
             if not jobs:
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Government Agency',
-                    'description': f"Singapore government sector opportunities for {job_title}",
-                    'source': 'Careers@Gov',
-                    'url': url  # Include search URL
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Government Agency',
+                    description=f"Singapore government sector opportunities for {job_title}",
+                    source='Careers@Gov',
+                    url=url  # Include search URL
+                ))
                 
         except Exception as e:
             logger.warning(f"Careers@Gov search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Government Agency',
-                'description': 'Careers@Gov data unavailable',
-                'source': 'Careers@Gov (Limited)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Government Agency',
+                description='Careers@Gov data unavailable',
+                source='Careers@Gov (Limited)'
+            ))
         
         return jobs
     
-    def scrape_linkedin_job_url(self, job_url: str) -> Optional[Dict]:
+    def scrape_linkedin_job_url(self, job_url: str, force_refresh: bool = False) -> Optional[JobRecord]:
         """
-        Scrape a specific LinkedIn job posting URL.
+        Scrape a specific LinkedIn job posting URL (results cached per URL for an hour).
         
         Args:
             job_url: Direct LinkedIn job URL (e.g., https://www.linkedin.com/jobs/view/...)
+            force_refresh: Ignore any cached result and scrape again
             
         Returns:
-            Dictionary with job details or None if scraping fails
+            JobRecord with job details or None if scraping fails
         """
+        # Keyed on the posting ID, so slug, subdomain, query and trailing-slash variants share an entry
+        key = ('scrape_linkedin_job_url', _linkedin_job_id(job_url) or _canonicalize_url(job_url.split('?')[0]))
+        if not force_refresh:
+            cached = _SEARCH_CACHE.get(key)
+            if cached is not None:
+                logger.info(f"Cache hit: LinkedIn URL {job_url}")
+                return cached  # records are immutable - safe to share
+        
+        job = self._scrape_linkedin_job_url_uncached(job_url)
+        if job:
+            _SEARCH_CACHE.set(key, job)
+        return job
+    
+    def _scrape_linkedin_job_url_uncached(self, job_url: str) -> Optional[JobRecord]:
+        """Fetch and parse a LinkedIn job posting (see scrape_linkedin_job_url)."""
         try:
             logger.info(f"Scraping LinkedIn URL: {job_url}")
             
@@ -835,106 +1516,49 @@ Your response (just the number or NONE):"""
             else:
                 base_url = job_url
             
-            # Try multiple approaches to get the content
-            attempts = [
-                {
-                    'url': base_url,
-                    'headers': {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Cache-Control': 'max-age=0'
-                    }
-                },
-                {
-                    'url': job_url,  # Try original URL with params
-                    'headers': {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.5'
-                    }
-                }
-            ]
+            # Try multiple approaches to get the content: clean URL first, then original URL with params
+            attempts = ((base_url, _LINKEDIN_HEADERS_DESKTOP), (job_url, _LINKEDIN_HEADERS_MAC))
             
-            response = None
-            for attempt in attempts:
-                try:
-                    time.sleep(random.uniform(2, 4))  # Random delay between attempts
-                    response = requests.get(
-                        attempt['url'], 
-                        headers=attempt['headers'], 
-                        timeout=20,
-                        verify=False,
-                        allow_redirects=True
-                    )
-                    if response.status_code == 200:
-                        logger.info("Successfully retrieved LinkedIn page")
-                        break
-                    else:
-                        logger.warning(f"Attempt failed with status code: {response.status_code}")
-                except Exception as e:
-                    logger.warning(f"Attempt failed: {str(e)}")
-                    continue
+            # Pooled sessions keep LinkedIn's cookies, so warmed-up sessions are not challenged again
+            pool = self._linkedin_pool
+            session = pool.acquire()
+            html = None
+            try:
+                for idx, (attempt_url, attempt_headers) in enumerate(attempts):
+                    try:
+                        if idx > 0:
+                            # Back off only before a retry - the first attempt goes out immediately
+                            time.sleep(random.uniform(1.0, 2.0) * (2 ** (idx - 1)))
+                        html = self._stream_html(attempt_url, 20, headers=attempt_headers, session=session)
+                        if html:
+                            logger.info("Successfully retrieved LinkedIn page")
+                            break
+                        else:
+                            logger.warning(f"Attempt failed: {attempt_url}")
+                    except Exception as e:
+                        logger.warning(f"Attempt failed: {str(e)}")
+                        continue
+            finally:
+                pool.release(session, ok=bool(html))
             
-            if not response or response.status_code != 200:
+            if not html:
                 logger.warning(f"All attempts failed to retrieve LinkedIn page")
                 return None
             
-            # Successfully got the page
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract job title
-            job_title = None
-            title_selectors = [
-                ('h1', {'class': 'top-card-layout__title'}),
-                ('h2', {'class': 'topcard__title'}),
-                ('h1', {'class': 'topcard__title'}),
-                ('h1', None)
-            ]
+            # Successfully got the page - only build the title/company/description sections
+            soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_LINKEDIN_STRAINER)
             
-            for tag, attrs in title_selectors:
-                title_elem = soup.find(tag, attrs) if attrs else soup.find(tag)
-                if title_elem:
-                    job_title = title_elem.get_text(strip=True)
-                    break
-            
-            # Extract company name
-            company_name = None
-            company_selectors = [
-                ('a', {'class': 'topcard__org-name-link'}),
-                ('span', {'class': 'topcard__flavor'}),
-                ('a', {'class': 'sub-nav-cta__optional-url'})
-            ]
-            
-            for tag, attrs in company_selectors:
-                company_elem = soup.find(tag, attrs)
-                if company_elem:
-                    company_name = company_elem.get_text(strip=True)
-                    break
+            # Extract job title and company name (selectors in priority order)
+            job_title = self._select_first_text(soup, _LINKEDIN_TITLE_SELECTORS)
+            company_name = self._select_first_text(soup, _LINKEDIN_COMPANY_SELECTORS)
             
             # Extract job description
             description = None
-            desc_selectors = [
-                ('div', {'class': 'show-more-less-html__markup'}),
-                ('div', {'class': 'description__text'}),
-                ('section', {'class': 'description'}),
-                ('div', {'class': 'core-section-container__content'})
-            ]
-            
-            for tag, attrs in desc_selectors:
-                desc_elem = soup.find(tag, attrs)
+            for selector in _LINKEDIN_DESC_SELECTORS:
+                desc_elem = soup.select_one(selector)
                 if desc_elem:
-                    # Get text and clean up
-                    description = desc_elem.get_text(separator='\n', strip=True)
-                    # Remove excessive whitespace
-                    description = '\n'.join([line.strip() for line in description.split('\n') if line.strip()])
+                    # Get text and collapse blank/indented lines in a single pass
+                    description = _WS_RE.sub('\n', desc_elem.get_text(separator='\n', strip=True)).strip()
                     break
             
             # If no structured description found, try to get any visible text
@@ -946,13 +1570,13 @@ Your response (just the number or NONE):"""
             
             # Build result
             if job_title or description:
-                return {
-                    'title': job_title or 'LinkedIn Job',
-                    'company': company_name or 'Company',
-                    'description': description or 'Job description extracted from LinkedIn',
-                    'source': 'LinkedIn',
-                    'url': job_url
-                }
+                return JobRecord(
+                    title=job_title or 'LinkedIn Job',
+                    company=company_name or 'Company',
+                    description=description or 'Job description extracted from LinkedIn',
+                    source='LinkedIn',
+                    url=job_url
+                )
             else:
                 logger.warning("Could not extract job details from LinkedIn page")
                 return None
@@ -961,7 +1585,15 @@ Your response (just the number or NONE):"""
             logger.error(f"Error scraping LinkedIn URL: {e}")
             return None
     
-    def search_linkedin(self, job_title: str, company: str = "", linkedin_url: Optional[str] = None, api_key: Optional[str] = None) -> List[Dict]:
+    def _scrape_linkedin_job_urls(self, job_urls: List[str], concurrency: int = _LINKEDIN_SCRAPE_CONCURRENCY) -> List[JobRecord]:
+        """Scrape several LinkedIn job URLs with bounded concurrency, keeping input order and dropping failures."""
+        if not job_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(job_urls)))) as executor:
+            return [job for job in executor.map(self.scrape_linkedin_job_url, job_urls) if job]
+    
+    @_cached_portal_search
+    def search_linkedin(self, job_title: str, company: str = "", linkedin_url: Optional[str] = None, api_key: Optional[str] = None) -> List[JobRecord]:
         """
         Intelligently search LinkedIn for jobs using AI-powered discovery.
         
@@ -972,7 +1604,7 @@ Your response (just the number or NONE):"""
             api_key: OpenAI API key for enhanced search (optional)
             
         Returns:
-            List of job dictionaries with discovered URLs
+            List of JobRecords with discovered URLs
         """
         jobs = []
         
@@ -984,216 +1616,255 @@ Your response (just the number or NONE):"""
                 jobs.append(scraped_job)
                 return jobs
         
-        # Strategy 1: AI-powered web search to find LinkedIn URL
-        logger.info("🤖 Attempting AI-powered LinkedIn job discovery...")
-        discovered_url = self.ai_search_linkedin_url(company, job_title, api_key)
-        if discovered_url:
-            logger.info(f"✅ AI discovered LinkedIn URL: {discovered_url}")
-            scraped_job = self.scrape_linkedin_job_url(discovered_url)
-            if scraped_job:
-                jobs.append(scraped_job)
-                return jobs
+        # Use centralized company name expansion
+        company_expanded = self._expand_company_name(company)
+        
+        # Build search query with expanded company name
+        search_query = f"{job_title} {company_expanded}".strip()
+        
+        # Use single best search URL (don't try multiple to save time)
+        search_url = f"{_LINKEDIN_SEARCH_URL}?{urlencode({'keywords': search_query, 'location': 'Singapore'})}"
         
-        # Try to search LinkedIn for matching jobs using multiple strategies
         try:
+            # Strategy 1: AI-powered web search to find LinkedIn URL
+            logger.info("🤖 Attempting AI-powered LinkedIn job discovery...")
+            discovered_url = self.ai_search_linkedin_url(company, job_title, api_key)
+            if discovered_url:
+                logger.info(f"✅ AI discovered LinkedIn URL: {discovered_url}")
+                scraped_job = self.scrape_linkedin_job_url(discovered_url)
+                if scraped_job:
+                    jobs.append(scraped_job)
+                    return jobs
+            
+            # Strategy 2: LinkedIn's own search results - only fetched after a discovery miss, so a hit
+            # costs LinkedIn a single request
             logger.info(f"Searching LinkedIn for: {job_title} at {company}")
+            job_hrefs = self._fetch_linkedin_search_links(search_url)
             
-            # Use centralized company name expansion
-            company_expanded = self._expand_company_name(company)
-            
-            # Build search query with expanded company name
-            search_query = f"{job_title} {company_expanded}".strip().replace(' ', '%20')
-            
-            # Use single best search URL (don't try multiple to save time)
-            search_url = f"https://www.linkedin.com/jobs/search?keywords={search_query}&location=Singapore"
-            
-            logger.info(f"Quick LinkedIn HTML search...")
-            
-            # Add headers to mimic browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            # Try once with shorter timeout (fast!)
-            try:
-                response = requests.get(search_url, headers=headers, timeout=5, verify=False, allow_redirects=True)
+            if job_hrefs and api_key:
+                logger.info(f"Found {len(job_hrefs)} potential job links - using AI to filter by company")
                 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Look for LinkedIn job links quickly - get up to 5 to check
-                    job_links = soup.find_all('a', href=lambda x: x and '/jobs/view/' in x, limit=5)
-                    
-                    if job_links and api_key:
-                        logger.info(f"Found {len(job_links)} potential job links - using AI to filter by company")
-                        
-                        # Scrape all found jobs
-                        potential_jobs = []
-                        for link in job_links:
-                            job_url = link['href']
-                            if not job_url.startswith('http'):
-                                job_url = 'https://www.linkedin.com' + job_url
-                            
-                            scraped_job = self.scrape_linkedin_job_url(job_url)
-                            if scraped_job:
-                                potential_jobs.append(scraped_job)
-                        
-                        if potential_jobs:
-                            # Use AI to select the best matching job
-                            logger.info(f"🤖 Using AI to select best match for {company}...")
-                            best_job = self._ai_select_best_job_match(potential_jobs, company, company_expanded, job_title, api_key)
-                            if best_job:
-                                jobs.append(best_job)
-                                return jobs
-                    
-                    elif job_links:
-                        logger.info(f"Found {len(job_links)} potential job links")
-                        # Fallback: just take first one if no API key
-                        for link in job_links[:1]:
-                            job_url = link['href']
-                            if not job_url.startswith('http'):
-                                job_url = 'https://www.linkedin.com' + job_url
-                            
-                            logger.info(f"Scraping first LinkedIn result...")
-                            scraped_job = self.scrape_linkedin_job_url(job_url)
-                            if scraped_job:
-                                jobs.append(scraped_job)
-                                return jobs
-                    else:
-                        logger.info("No job links found in HTML")
-                else:
-                    logger.warning(f"LinkedIn returned status: {response.status_code}")
+                # Scrape all found jobs concurrently
+                job_urls = self._unique_job_urls(job_hrefs, 'https://www.linkedin.com')
+                potential_jobs = self._scrape_linkedin_job_urls(job_urls)
                 
-            except Exception as e:
-                logger.debug(f"LinkedIn HTML search failed: {e}")
+                if potential_jobs:
+                    # Use AI to select the best matching job
+                    logger.info(f"🤖 Using AI to select best match for {company}...")
+                    best_job = self._ai_select_best_job_match(potential_jobs, company, company_expanded, job_title, api_key)
+                    if best_job:
+                        jobs.append(best_job)
+                        return jobs
+            
+            elif job_hrefs:
+                logger.info(f"Found {len(job_hrefs)} potential job links")
+                # Fallback: just take first one if no API key
+                job_url = job_hrefs[0]
+                if not job_url.startswith('http'):
+                    job_url = 'https://www.linkedin.com' + job_url
+                
+                logger.info(f"Scraping first LinkedIn result...")
+                scraped_job = self.scrape_linkedin_job_url(job_url)
+                if scraped_job:
+                    jobs.append(scraped_job)
+                    return jobs
         
         except Exception as e:
             logger.warning(f"LinkedIn search error: {e}")
         
         # If search didn't work, return placeholder with search URL
         if not jobs:
-            # Use the first search URL as reference
-            fallback_search_query = f"{job_title} {company_expanded}".strip().replace(' ', '%20')
-            fallback_url = f"https://www.linkedin.com/jobs/search?keywords={fallback_search_query}&location=Singapore"
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"LinkedIn auto-search attempted with multiple strategies but no matching jobs found. LinkedIn may require login or has anti-bot protection. You can try: 1) Search manually on LinkedIn, or 2) Provide a direct LinkedIn job URL for guaranteed results.",
-                'source': 'LinkedIn (Search Limited)',
-                'url': fallback_url
-            })
+            # Use the search URL as reference
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"LinkedIn auto-search attempted with multiple strategies but no matching jobs found. LinkedIn may require login or has anti-bot protection. You can try: 1) Search manually on LinkedIn, or 2) Provide a direct LinkedIn job URL for guaranteed results.",
+                source='LinkedIn (Search Limited)',
+                url=search_url
+            ))
         
         return jobs
     
-    def search_foundit(self, job_title: str, company: str = "") -> List[Dict]:
+    def _fetch_linkedin_search_links(self, search_url: str) -> List[str]:
+        """Hrefs of up to 5 job links on a LinkedIn search results page (empty on any failure)."""
+        logger.info(f"Quick LinkedIn HTML search...")
+        try:
+            # Try once with shorter timeout (fast!)
+            with self.session.get(search_url, headers=_LINKEDIN_SEARCH_HEADERS, timeout=5, allow_redirects=True, stream=True) as response:
+                if response.status_code != 200:
+                    # Don't download the error page - the connection is released on exit
+                    logger.warning(f"LinkedIn returned status: {response.status_code}")
+                    return []
+                soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_LINKEDIN_JOB_LINK_STRAINER)
+        except Exception as e:
+            logger.debug(f"LinkedIn HTML search failed: {e}")
+            return []
+        
+        # Look for LinkedIn job links quickly - get up to 5 to check
+        hrefs = [link['href'] for link in soup.find_all('a', href=_LINKEDIN_JOB_HREF_RE, limit=5)]
+        if not hrefs:
+            logger.info("No job links found in HTML")
+        return hrefs
+    
+    def search_foundit(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Foundit search (placeholder)."""
-        return [{
-            'title': job_title,
-            'company': company or 'Company',
-            'description': f"Foundit job data for {job_title} - limited access in cloud",
-            'source': 'Foundit'
-        }]
-    
-    def search_jobscentral(self, job_title: str, company: str = "") -> List[Dict]:
+        return [self._placeholder_job('Foundit', job_title, company)]
+    
+    def search_jobscentral(self, job_title: str, company: str = "") -> List[JobRecord]:
         """JobsCentral search (placeholder)."""
-        return [{
-            'title': job_title,
-            'company': company or 'Company',
-            'description': f"JobsCentral data for {job_title} - cloud deployment limitations",
-            'source': 'JobsCentral'
-        }]
-    
-    def search_all_portals(self, job_title: str, company: str = "", max_results_per_portal: int = 2, linkedin_url: Optional[str] = None, api_key: Optional[str] = None) -> List[Dict]:
-        """Search all available portals: LinkedIn (with AI discovery), Indeed, JobStreet, MyCareersFuture, Careers@Gov."""
+        return [self._placeholder_job('JobsCentral', job_title, company)]
+    
+    def _placeholder_job(self, source: str, job_title: str, company: str) -> JobRecord:
+        """Build the canned record for a portal we don't scrape (see _PLACEHOLDER_PORTALS)."""
+        description, url_template = _PLACEHOLDER_PORTALS[source]
+        url = None
+        if url_template:
+            url = url_template.format(query=quote_plus(f"{job_title} {company}".strip()))
+        return JobRecord(
+            title=job_title,
+            company=company or 'Company',
+            description=description.format(job_title=job_title),
+            source=source,
+            url=url
+        )
+    
+    def search_all_portals(self, job_title: str, company: str = "", max_results_per_portal: int = 2, linkedin_url: Optional[str] = None,
+                           api_key: Optional[str] = None, force_refresh: bool = False, exhaustive: bool = False) -> List[JobRecord]:
+        """
+        Search all available portals: LinkedIn (with AI discovery), Indeed, JobStreet, MyCareersFuture, Careers@Gov.
+        Portal results are cached for an hour; pass force_refresh=True to re-scrape.
+        
+        LinkedIn is searched first; if it yields a scraped job posting the other portals are skipped
+        unless exhaustive=True.
+        """
         all_jobs = []
         
         # Note: Web scraping is limited in Streamlit Community Cloud
-        # LinkedIn now uses AI-powered URL discovery
+        # LinkedIn now uses AI-powered URL discovery unless a direct job URL is given
+        if not (linkedin_url and 'linkedin.com/jobs/view' in linkedin_url):
+            linkedin_url = None
         
+        # (portal, search method, extra kwargs, result cap) - portals are independent I/O;
+        # a None method is a placeholder portal, built inline without a worker thread
+        portals = [
+            ('LinkedIn', self.search_linkedin, {'linkedin_url': linkedin_url, 'api_key': api_key}, max_results_per_portal),
+            ('Indeed', self.search_indeed, {'limit': max_results_per_portal}, max_results_per_portal),
+            ('JobStreet', self.search_jobstreet, {}, 1),
+            ('MyCareersFuture', None, {}, 1),
+            ('Careers@Gov', self.search_careers_gov_sg, {}, 1),
+        ]
+        
+        executor = ThreadPoolExecutor(max_workers=sum(1 for _, search, _, _ in portals if search))
         try:
-            # Search LinkedIn with AI-powered discovery (no hard-coding!)
-            if linkedin_url and 'linkedin.com/jobs/view' in linkedin_url:
-                # User provided URL
-                linkedin_jobs = self.search_linkedin(job_title, company, linkedin_url=linkedin_url, api_key=api_key)
-            else:
-                # AI discovers URL automatically
-                linkedin_jobs = self.search_linkedin(job_title, company, linkedin_url=None, api_key=api_key)
-            
-            all_jobs.extend(linkedin_jobs[:max_results_per_portal])
-            self._delay()
-            
-            # Search Indeed (most reliable)
-            indeed_jobs = self.search_indeed(job_title, company)
-            all_jobs.extend(indeed_jobs[:max_results_per_portal])
-            self._delay()
-            
-            # Search JobStreet
-            jobstreet_jobs = self.search_jobstreet(job_title, company)
-            all_jobs.extend(jobstreet_jobs[:1])
-            self._delay()
-            
-            # Search MyCareersFuture
-            mycareersfuture_jobs = self.search_mycareersfuture(job_title, company)
-            all_jobs.extend(mycareersfuture_jobs[:1])
-            self._delay()
+            # Phase 1: LinkedIn alone - a real posting (not the search-page placeholder) is usually all we need
+            portal, search, kwargs, cap = portals[0]
+            try:
+                linkedin_jobs = executor.submit(
+                    search, job_title, company, force_refresh=force_refresh, **kwargs
+                ).result(timeout=_PORTAL_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.error(f"Error searching {portal}: {e}")
+                linkedin_jobs = []
             
-            # Search Careers@Gov (Singapore government portal)
-            careers_gov_jobs = self.search_careers_gov_sg(job_title, company)
-            all_jobs.extend(careers_gov_jobs[:1])
+            if linkedin_jobs and linkedin_jobs[0].source == 'LinkedIn' and not exhaustive:
+                return linkedin_jobs[:cap]
+            all_jobs.extend(linkedin_jobs[:cap])
             
-        except Exception as e:
-            logger.error(f"Error in search_all_portals: {e}")
-            # Provide fallback data
-            all_jobs = [{
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"Cloud deployment - web scraping limitations. Generating description for {job_title} role.",
-                'source': 'System Generated'
-            }]
+            # Phase 2: remaining portals in parallel
+            futures = [
+                executor.submit(search, job_title, company, force_refresh=force_refresh, **kwargs) if search else None
+                for _, search, kwargs, _ in portals[1:]
+            ]
+            # Collect in portal order so Indeed results stay first
+            for (portal, _, _, cap), future in zip(portals[1:], futures):
+                if future is None:
+                    all_jobs.append(self._placeholder_job(portal, job_title, company))
+                    continue
+                try:
+                    all_jobs.extend(future.result(timeout=_PORTAL_TIMEOUT_SECONDS)[:cap])
+                except Exception as e:
+                    logger.error(f"Error searching {portal}: {e}")
+        finally:
+            # Don't block on a portal that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # Ensure we have at least one result
         if not all_jobs:
-            all_jobs = [{
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"No web results found. Generating description for {job_title} position at {company}.",
-                'source': 'System Fallback'
-            }]
+            all_jobs = [JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"No web results found. Generating description for {job_title} position at {company}.",
+                source='System Fallback'
+            )]
+        
+        return all_jobs  # already bounded by the per-portal caps
+    
+    async def search_all_portals_async(self, job_title: str, company: str = "", max_results_per_portal: int = 2,
+                                       linkedin_url: Optional[str] = None, api_key: Optional[str] = None,
+                                       force_refresh: bool = False, exhaustive: bool = False) -> List[JobRecord]:
+        """
+        Awaitable search_all_portals for asyncio callers.
+        
+        The portal fan-out runs on the scraper's worker threads, so the event loop is never blocked.
+        """
+        return await asyncio.to_thread(
+            self.search_all_portals, job_title, company, max_results_per_portal, linkedin_url, api_key, force_refresh,
+            exhaustive
+        )
+    
+    def search_many(self, queries: List[Tuple[str, str]], max_results_per_portal: int = 2,
+                    api_key: Optional[str] = None, concurrency: int = 4) -> List[List[JobRecord]]:
+        """
+        Run search_all_portals for many (job_title, company) pairs with bounded concurrency.
+        
+        Args:
+            queries: List of (job_title, company) tuples
+            max_results_per_portal: Passed through to search_all_portals
+            api_key: OpenAI API key (for AI-enhanced LinkedIn matching)
+            concurrency: Maximum number of searches in flight at once (each fans out over the portals)
+            
+        Returns:
+            List of result lists in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        workers = max(1, min(concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map preserves input order
+            return list(executor.map(
+                lambda query: self.search_all_portals(query[0], query[1], max_results_per_portal, api_key=api_key),
+                queries
+            ))
+    
+    async def search_many_async(self, queries: List[Tuple[str, str]], max_results_per_portal: int = 2,
+                                api_key: Optional[str] = None, concurrency: int = 10) -> List[List[JobRecord]]:
+        """Awaitable search_many: all queries are gathered at once, at most `concurrency` running."""
+        semaphore = asyncio.Semaphore(concurrency)
         
-        return all_jobs[:5]  # Limit total results
+        async def search(job_title: str, company: str) -> List[JobRecord]:
+            async with semaphore:
+                return await self.search_all_portals_async(job_title, company, max_results_per_portal, api_key=api_key)
+        
+        return list(await asyncio.gather(*(search(job_title, company) for job_title, company in queries)))
     
-    def extract_job_details(self, job_results: List[Dict]) -> str:
+    def extract_job_details(self, job_results: List[JobRecord]) -> str:
         """Extract and format job details for AI processing."""
         if not job_results:
             return "No job market data available. Generating description from input only."
         
-        formatted_results = []
-        for idx, job in enumerate(job_results[:3], 1):  # Limit to top 3
-            formatted_results.append(
-                f"Job {idx}:\n"
-                f"Title: {job.get('title', 'N/A')}\n"
-                f"Company: {job.get('company', 'N/A')}\n"
-                f"Description: {job.get('description', 'N/A')}\n"
-                f"Source: {job.get('source', 'N/A')}"
-            )
-        
-        return "\n\n---\n\n".join(formatted_results)
+        return "\n\n---\n\n".join(
+            _JOB_DETAILS_TEMPLATE.format(idx=idx, job=job)
+            for idx, job in enumerate(job_results[:3], 1)  # Limit to top 3
+        )
     
     def get_job_suggestions(self, job_title: str, company: str = "") -> List[str]:
         """Get job suggestions based on search results."""
         try:
-            results = self.search_all_portals(job_title, company, max_results_per_portal=1)
-            suggestions = []
-            
-            for job in results:
-                if job.get('title') and job['title'] not in suggestions:
-                    suggestions.append(job['title'])
-            
+            # Suggestions need titles from every portal, not just the first LinkedIn hit
+            results = self.search_all_portals(job_title, company, max_results_per_portal=1, exhaustive=True)
+            # dict.fromkeys de-duplicates in first-seen order
+            suggestions = list(dict.fromkeys(job.title for job in results if job.title))
             return suggestions[:5]  # Return top 5 suggestions
             
         except Exception as e:
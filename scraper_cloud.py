@@ -4,49 +4,353 @@ Searches job portals without Selenium for Streamlit Community Cloud deployment.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
+import re
+import asyncio
 import time
 import random
-from typing import List, Dict, Optional
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlencode
 import logging
 import streamlit as st
 
+from scraper import JobRecord, _ERROR_SOURCES, _TTLCache, _JOB_DETAILS_TEMPLATE, _WS_RE, _SectionStrainer
+
+try:
+    from lxml import etree, html as lxml_html  # C parser backend for BeautifulSoup, and direct XPath
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    etree = lxml_html = None
+    _HTML_PARSER = 'html.parser'
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Silence per-request warnings once for the unverified (verify=False) portal requests
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Company abbreviation -> expanded name for LinkedIn searches
+_COMPANY_ABBREVIATIONS = {
+    'mindef': "Ministry of Defence Singapore",
+    'mod': "Ministry of Defence Singapore",
+    'moe': "Ministry of Education Singapore",
+    'moh': "Ministry of Health Singapore",
+}
+# One scan for any whole-word abbreviation; 'mod' only expands on an exact match
+_COMPANY_ABBREV_RE = re.compile(r'\b(?:%s)\b' % '|'.join(key for key in _COMPANY_ABBREVIATIONS if key != 'mod'))
+
+# Search endpoints (queries are appended with urlencode, so '&', '#' and '/' in titles are escaped)
+_INDEED_SEARCH_URL = "https://sg.indeed.com/jobs"
+_JOBSTREET_SEARCH_URL = "https://www.jobstreet.com.sg/jobs"
+_CAREERS_GOV_SEARCH_URL = "https://jobs.careers.gov.sg/jobs"
+_LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search"
+
+# Portal hosts primed at start-up: (URL, verify) - verify must match the later requests,
+# since connections are pooled per TLS setting
+_WARMUP_URLS = (
+    ('https://sg.indeed.com/', True),
+    ('https://www.jobstreet.com.sg/', True),
+    ('https://jobs.careers.gov.sg/', False),
+    ('https://www.linkedin.com/', False),
+)
+
+# Upper bound on how long search_all_portals waits for any single portal
+_PORTAL_TIMEOUT_SECONDS = 30
+
+# Validators kept for conditional LinkedIn re-fetches (most recently used job pages)
+_ETAG_CACHE_SIZE = 256
+_ETAG_CACHE_TTL_SECONDS = 24 * 3600
+
+# Minimum spacing between requests to the same host (different hosts are never delayed)
+_HOST_MIN_INTERVAL_SECONDS = 2.0
+
+# Only build DOM nodes for the LinkedIn sections we read; plain <h1> is the last-resort title selector
+_LINKEDIN_STRAINER = _SectionStrainer(re.compile(
+    r'title|topcard|top-card|description|show-more|core-section|flavor|org-name|sub-nav-cta'
+), tags=('h1',))
+
+# LinkedIn job page request headers; the User-Agent is picked per call from the pool below
+_LINKEDIN_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+_LINKEDIN_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# LinkedIn job page selectors, in priority order
+_LINKEDIN_TITLE_SELECTORS = (
+    ('h1', {'class': 'top-card-layout__title'}),
+    ('h2', {'class': 'topcard__title'}),
+    ('h1', {'class': 'topcard__title'}),
+    ('h1', None)
+)
+_LINKEDIN_COMPANY_SELECTORS = (
+    ('a', {'class': 'topcard__org-name-link'}),
+    ('span', {'class': 'topcard__flavor'}),
+    ('a', {'class': 'sub-nav-cta__optional-url'})
+)
+_LINKEDIN_DESC_SELECTORS = (
+    ('div', {'class': 'show-more-less-html__markup'}),
+    ('div', {'class': 'description__text'}),
+    ('section', {'class': 'description'}),
+    ('div', {'class': 'core-section-container__content'})
+)
+
+
+def _build_field_dispatch(*field_selectors) -> Dict[str, tuple]:
+    """Map tag -> ((class or None, field index, selector rank), ...) across several fields' selector lists."""
+    dispatch = {}
+    for field, selectors in enumerate(field_selectors):
+        for rank, (tag, attrs) in enumerate(selectors):
+            dispatch.setdefault(tag, []).append((attrs['class'] if attrs else None, field, rank))
+    return {tag: tuple(entries) for tag, entries in dispatch.items()}
+
+
+# Single-pass extraction over the three selector lists above (field 0 title, 1 company, 2 description)
+_LINKEDIN_FIELD_DISPATCH = _build_field_dispatch(
+    _LINKEDIN_TITLE_SELECTORS, _LINKEDIN_COMPANY_SELECTORS, _LINKEDIN_DESC_SELECTORS
+)
+_LINKEDIN_WALK_TAGS = tuple(_LINKEDIN_FIELD_DISPATCH)
+
+if etree is not None:
+    # Visible text nodes, as BeautifulSoup's get_text() sees them
+    _TEXT_XP = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+# LinkedIn job pages: stop downloading once one of these description blocks (or another div whose
+# class mentions "description") has closed with text in it
+_LINKEDIN_DESC_CLASSES = frozenset({'show-more-less-html__markup', 'description__text', 'description'})
+_MAX_HTML_BYTES = 1024 * 1024
+_HTML_CHUNK_SIZE = 16 * 1024
+
+# Compiled once at import instead of a per-node Python class filter
+_LINKEDIN_JOB_CARD_SEL = sv.compile('div[class*="job" i][class*="card" i]')
+_LINKEDIN_JOB_ITEM_SEL = sv.compile('li[class*="job" i]')
+_CAREERS_GOV_JOB_CARD_SEL = sv.compile('div[class*="job" i]')
+_DESCRIPTION_DIV_SEL = sv.compile('div[class*="description" i]')
+
+
+class _HostRateLimiter:
+    """Per-host politeness: a request waits only if the same host was hit less than min_interval ago."""
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = defaultdict(float)  # host -> earliest monotonic time of the next request
+    
+    def wait(self, url: str):
+        host = urlsplit(url).hostname
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot[host])
+            self._next_slot[host] = start + self.min_interval * random.uniform(1, 1.5)
+        # Sleep outside the lock so other hosts are never held up
+        if start > now:
+            time.sleep(start - now)
+
+
+def _node_text(node, separator: str = '') -> str:
+    """Equivalent of BeautifulSoup's get_text(separator, strip=True) for an lxml element."""
+    return separator.join(text for text in (text.strip() for text in _TEXT_XP(node)) if text)
+
+
+def _is_description_block(elem) -> bool:
+    """Whether a closed element is one of the description blocks _parse_linkedin_job reads (incl. its fallback div)."""
+    class_attr = elem.get('class', '')
+    return (bool(_LINKEDIN_DESC_CLASSES.intersection(class_attr.split()))
+            or (elem.tag == 'div' and 'description' in class_attr.lower()))
+
+
+def _parse_linkedin_job_lxml(html: bytes) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    _parse_linkedin_job in one walk over the tree: every candidate element is checked against all
+    three fields' selectors at once, stopping as soon as each field has its top-priority match.
+    """
+    tree = lxml_html.fromstring(html, parser=lxml_html.HTMLParser(encoding='utf-8'))
+    
+    # Best (element, selector rank) so far for title, company, description
+    best = [(None, len(_LINKEDIN_TITLE_SELECTORS)), (None, len(_LINKEDIN_COMPANY_SELECTORS)),
+            (None, len(_LINKEDIN_DESC_SELECTORS))]
+    description_div = None  # fallback: first div whose class mentions "description"
+    top_desc_has_text = None  # whether the top-priority description block has any text (checked once)
+    for _, elem in etree.iterwalk(tree, events=('start',), tag=_LINKEDIN_WALK_TAGS):
+        class_attr = elem.get('class', '')
+        classes = class_attr.split()
+        for cls, field, rank in _LINKEDIN_FIELD_DISPATCH[elem.tag]:
+            if rank < best[field][1] and (cls is None or cls in classes):
+                best[field] = (elem, rank)
+        if description_div is None and elem.tag == 'div' and 'description' in class_attr.lower():
+            description_div = elem
+        if not (best[0][1] or best[1][1] or best[2][1]):
+            # An empty top description block still needs the "description" div fallback
+            if top_desc_has_text is None:
+                top_desc_has_text = bool(_node_text(best[2][0]))
+            if top_desc_has_text or description_div is not None:
+                break
+    (title_elem, _), (company_elem, _), (desc_elem, _) = best
+    
+    description = None
+    if desc_elem is not None:
+        description = _WS_RE.sub('\n', _node_text(desc_elem, '\n')).strip()
+    if not description and description_div is not None:
+        description = _node_text(description_div, '\n')
+    
+    return (
+        _node_text(title_elem) if title_elem is not None else None,
+        _node_text(company_elem) if company_elem is not None else None,
+        description or None
+    )
+
+
+def _parse_linkedin_job(html: bytes) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract (title, company, description) from a LinkedIn job page; missing fields are None."""
+    if etree is not None:
+        return _parse_linkedin_job_lxml(html)
+    
+    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_LINKEDIN_STRAINER)
+    
+    # Extract job title
+    job_title = None
+    for tag, attrs in _LINKEDIN_TITLE_SELECTORS:
+        title_elem = soup.find(tag, attrs) if attrs else soup.find(tag)
+        if title_elem:
+            job_title = title_elem.get_text(strip=True)
+            break
+    
+    # Extract company name
+    company_name = None
+    for tag, attrs in _LINKEDIN_COMPANY_SELECTORS:
+        company_elem = soup.find(tag, attrs)
+        if company_elem:
+            company_name = company_elem.get_text(strip=True)
+            break
+    
+    # Extract job description
+    description = None
+    for tag, attrs in _LINKEDIN_DESC_SELECTORS:
+        desc_elem = soup.find(tag, attrs)
+        if desc_elem:
+            # Get text and collapse blank/indented lines in a single pass
+            description = _WS_RE.sub('\n', desc_elem.get_text(separator='\n', strip=True)).strip()
+            break
+    
+    # If no structured description found, try to get any visible text
+    if not description:
+        # Look for any div containing substantial text
+        content_divs = _DESCRIPTION_DIV_SEL.select(soup, limit=1)
+        if content_divs:
+            description = content_divs[0].get_text(separator='\n', strip=True)
+    
+    return job_title, company_name, description
+
+
+@lru_cache(maxsize=128)
+def _format_job_details(jobs: Tuple[JobRecord, ...]) -> str:
+    """Format job records for AI processing; records are immutable, so Streamlit reruns reuse the text."""
+    return "\n\n---\n\n".join(_JOB_DETAILS_TEMPLATE.format(idx=idx, job=job) for idx, job in enumerate(jobs, 1))
+
+
+# Portal results shared by all scrapers in the process (Streamlit reruns reuse them)
+_SEARCH_CACHE = _TTLCache(maxsize=256, ttl=3600)
+
+
+def _cached_portal_search(method):
+    """
+    Cache a search_* method's results in _SEARCH_CACHE for an hour, keyed by (portal, job_title, company, options).
+    Pass force_refresh=True to re-scrape. Empty and error-placeholder results are never stored.
+    """
+    @wraps(method)
+    def wrapper(self, job_title: str, company: str = "", force_refresh: bool = False, **kwargs):
+        key = (method.__name__, job_title.strip(), company.strip(), tuple(sorted(kwargs.items())))
+        if not force_refresh:
+            cached = _SEARCH_CACHE.get(key)
+            if cached is not None:
+                return list(cached)
+        
+        jobs = method(self, job_title, company, **kwargs)
+        if jobs and not any(job.source in _ERROR_SOURCES for job in jobs):
+            _SEARCH_CACHE.set(key, list(jobs))
+        return jobs
+    
+    return wrapper
+
 
 class JobPortalScraper:
     """Scrapes job descriptions from job portals - Cloud compatible version."""
     
-    def __init__(self):
+    def __init__(self, warmup: bool = False):
+        """
+        Args:
+            warmup: Open connections to the portal hosts in the background so the first search skips DNS/TLS setup
+                (worth it for a long-lived instance, e.g. one behind st.cache_resource; off for short-lived ones)
+        """
         self.session = requests.Session()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,  # includes br when brotli is installed
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
         self.session.headers.update(self.headers)
-        # Disable SSL verification warnings (for environments with SSL issues)
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # Pooled keep-alive connections shared by every portal and LinkedIn request
+        # Backoff (honouring Retry-After) only when a portal throttles or errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._rate_limiter = _HostRateLimiter(_HOST_MIN_INTERVAL_SECONDS)
+        # LinkedIn job URL -> (ETag, Last-Modified, parsed JobRecord) for conditional re-fetches;
+        # bounded, since an app-wide instance lives as long as the process
+        self._etag_cache = _TTLCache(maxsize=_ETAG_CACHE_SIZE, ttl=_ETAG_CACHE_TTL_SECONDS)
+        if warmup:
+            threading.Thread(target=self._warmup, daemon=True).start()
     
-    def _delay(self):
-        """Add random delay between requests to avoid rate limiting."""
-        time.sleep(random.uniform(1, 3))
+    def _warmup(self):
+        """HEAD each portal host once so the session's pool holds live keep-alive connections."""
+        for url, verify in _WARMUP_URLS:
+            try:
+                self.session.head(url, timeout=3, verify=verify, allow_redirects=False)
+            except Exception as e:
+                logger.debug(f"Warmup failed for {url}: {e}")
     
-    def search_indeed(self, job_title: str, company: str = "") -> List[Dict]:
+    @_cached_portal_search
+    def search_indeed(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search Indeed jobs with basic HTTP requests (cloud-friendly)."""
         jobs = []
         try:
             search_query = f"{job_title} {company}".strip()
-            url = f"https://sg.indeed.com/jobs?q={search_query.replace(' ', '+')}&l=Singapore"
+            url = f"{_INDEED_SEARCH_URL}?{urlencode({'q': search_query, 'l': 'Singapore'})}"
             
             response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, _HTML_PARSER)
                 
                 # Basic parsing for Indeed (may be limited due to anti-bot measures)
                 job_cards = soup.find_all('div', {'data-jk': True})[:3]  # Limit to 3 results
@@ -57,140 +361,167 @@ class JobPortalScraper:
                         company_elem = card.find('span', {'class': 'companyName'})
                         
                         if title_elem and company_elem:
-                            jobs.append({
-                                'title': title_elem.get_text(strip=True),
-                                'company': company_elem.get_text(strip=True),
-                                'description': f"Job posting from Indeed for {job_title}",
-                                'source': 'Indeed'
-                            })
+                            jobs.append(JobRecord(
+                                title=title_elem.get_text(strip=True),
+                                company=company_elem.get_text(strip=True),
+                                description=f"Job posting from Indeed for {job_title}",
+                                source='Indeed'
+                            ))
                     except Exception as e:
                         logger.debug(f"Error parsing Indeed job card: {e}")
                         continue
             
             # If no results found, add placeholder
             if not jobs:
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Company',
-                    'description': 'Indeed search results limited in cloud deployment',
-                    'source': 'Indeed (Limited)'
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Company',
+                    description='Indeed search results limited in cloud deployment',
+                    source='Indeed (Limited)'
+                ))
                 
         except Exception as e:
             logger.warning(f"Indeed search error: {e}")
             # Add fallback data
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': 'Indeed unavailable - using fallback data',
-                'source': 'Indeed (Fallback)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description='Indeed unavailable - using fallback data',
+                source='Indeed (Fallback)'
+            ))
         
         return jobs
     
-    def search_jobstreet(self, job_title: str, company: str = "") -> List[Dict]:
+    @_cached_portal_search
+    def search_jobstreet(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search JobStreet (simplified for cloud deployment)."""
         jobs = []
         try:
             # JobStreet Singapore search
             search_query = f"{job_title} {company}".strip()
-            url = f"https://www.jobstreet.com.sg/jobs?keywords={search_query.replace(' ', '%20')}"
+            url = f"{_JOBSTREET_SEARCH_URL}?{urlencode({'keywords': search_query})}"
             
             response = self.session.get(url, timeout=10)
             if response.status_code == 200:
                 # Add basic job data (actual scraping may be limited)
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Company',
-                    'description': f"JobStreet posting for {job_title} - web scraping limited in cloud",
-                    'source': 'JobStreet'
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Company',
+                    description=f"JobStreet posting for {job_title} - web scraping limited in cloud",
+                    source='JobStreet'
+                ))
         
         except Exception as e:
             logger.warning(f"JobStreet search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company', 
-                'description': 'JobStreet unavailable - using placeholder data',
-                'source': 'JobStreet (Placeholder)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company', 
+                description='JobStreet unavailable - using placeholder data',
+                source='JobStreet (Placeholder)'
+            ))
         
         return jobs
     
-    def search_mycareersfuture(self, job_title: str, company: str = "") -> List[Dict]:
+    def search_mycareersfuture(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search MyCareersFuture (government job portal)."""
         jobs = []
         try:
             # MyCareersFuture API approach (simplified)
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"Government job portal data for {job_title} - actual API access limited in cloud deployment",
-                'source': 'MyCareersFuture'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"Government job portal data for {job_title} - actual API access limited in cloud deployment",
+                source='MyCareersFuture'
+            ))
             
         except Exception as e:
             logger.warning(f"MyCareersFuture search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': 'MyCareersFuture placeholder data',
-                'source': 'MyCareersFuture (Placeholder)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description='MyCareersFuture placeholder data',
+                source='MyCareersFuture (Placeholder)'
+            ))
         
         return jobs
     
-    def search_careers_gov_sg(self, job_title: str, company: str = "") -> List[Dict]:
+    @_cached_portal_search
+    def search_careers_gov_sg(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Search Careers@Gov (Singapore government careers portal)."""
         jobs = []
         try:
             # Careers@Gov portal search
             search_query = f"{job_title} {company}".strip()
-            url = f"https://jobs.careers.gov.sg/jobs?keywords={search_query.replace(' ', '%20')}"
+            url = f"{_CAREERS_GOV_SEARCH_URL}?{urlencode({'keywords': search_query})}"
             
             response = self.session.get(url, timeout=10, verify=False)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, _HTML_PARSER)
                 
                 # Try to parse job listings from Careers@Gov
-                job_cards = soup.find_all('div', {'class': lambda x: x and 'job' in str(x).lower()})[:2]
+                job_cards = _CAREERS_GOV_JOB_CARD_SEL.select(soup, limit=2)
                 
                 if job_cards:
                     for card in job_cards:
                         try:
                             title_elem = card.find(['h2', 'h3', 'h4'])
                             if title_elem:
-                                jobs.append({
-                                    'title': title_elem.get_text(strip=True),
-                                    'company': company or 'Government Agency',
-                                    'description': f"Government sector job posting for {job_title}",
-                                    'source': 'Careers@Gov'
-                                })
+                                jobs.append(JobRecord(
+                                    title=title_elem.get_text(strip=True),
+                                    company=company or 'Government Agency',
+                                    description=f"Government sector job posting for {job_title}",
+                                    source='Careers@Gov'
+                                ))
                         except Exception as e:
                             logger.debug(f"Error parsing Careers@Gov job card: {e}")
                             continue
             
             # If no results found, add placeholder
             if not jobs:
-                jobs.append({
-                    'title': job_title,
-                    'company': company or 'Government Agency',
-                    'description': f"Singapore government sector opportunities for {job_title}",
-                    'source': 'Careers@Gov'
-                })
+                jobs.append(JobRecord(
+                    title=job_title,
+                    company=company or 'Government Agency',
+                    description=f"Singapore government sector opportunities for {job_title}",
+                    source='Careers@Gov'
+                ))
                 
         except Exception as e:
             logger.warning(f"Careers@Gov search error: {e}")
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': 'Careers@Gov data unavailable',
-                'source': 'Careers@Gov (Limited)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description='Careers@Gov data unavailable',
+                source='Careers@Gov (Limited)'
+            ))
         
         return jobs
     
-    def scrape_linkedin_job_url(self, job_url: str) -> Optional[Dict]:
+    def _read_job_page(self, response: requests.Response) -> bytes:
+        """
+        Stream a LinkedIn job page body, stopping as soon as a description block with text has closed.
+        
+        The title and company sit in the top card above the description, so nothing after it is
+        needed. An empty description block doesn't stop the read: _parse_linkedin_job then falls back
+        to a later "description" div, which must still be downloaded. Without lxml (or if no
+        description is seen) the body is read up to _MAX_HTML_BYTES.
+        """
+        body = bytearray()
+        parser = etree.HTMLPullParser(events=('end',), tag=('div', 'section')) if etree is not None else None
+        try:
+            for chunk in response.iter_content(_HTML_CHUNK_SIZE):
+                body.extend(chunk)
+                if parser is not None:
+                    parser.feed(chunk)
+                    if any(_is_description_block(elem) and _node_text(elem) for _, elem in parser.read_events()):
+                        break
+                if len(body) >= _MAX_HTML_BYTES:
+                    break
+        finally:
+            # Releases the connection even when the rest of the body was never read
+            response.close()
+        return bytes(body)
+    
+    def scrape_linkedin_job_url(self, job_url: str) -> Optional[JobRecord]:
         """
         Scrape a specific LinkedIn job posting URL.
         
@@ -198,7 +529,7 @@ class JobPortalScraper:
             job_url: Direct LinkedIn job URL (e.g., https://www.linkedin.com/jobs/view/...)
             
         Returns:
-            Dictionary with job details or None if scraping fails
+            JobRecord with job details or None if scraping fails
         """
         try:
             logger.info(f"Scraping LinkedIn URL: {job_url}")
@@ -209,194 +540,70 @@ class JobPortalScraper:
             else:
                 base_url = job_url
             
-            # Try multiple approaches to get the content
-            attempts = [
-                {
-                    'url': base_url,
-                    'headers': {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Cache-Control': 'max-age=0'
-                    }
-                },
-                {
-                    'url': job_url,  # Try original URL with params
-                    'headers': {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.5'
-                    }
-                }
-            ]
-            
-            response = None
-            for attempt in attempts:
-                try:
-                    time.sleep(random.uniform(2, 4))  # Random delay between attempts
-                    response = requests.get(
-                        attempt['url'], 
-                        headers=attempt['headers'], 
-                        timeout=20,
-                        verify=False,
-                        allow_redirects=True
-                    )
-                    if response.status_code == 200:
-                        logger.info("Successfully retrieved LinkedIn page")
-                        break
-                    else:
-                        logger.warning(f"Attempt failed with status code: {response.status_code}")
-                except Exception as e:
-                    logger.warning(f"Attempt failed: {str(e)}")
-                    continue
-            
-            if not response or response.status_code != 200:
-                logger.warning(f"All attempts failed to retrieve LinkedIn page")
+            # Revalidate a previously scraped page instead of re-downloading it
+            cached = self._etag_cache.get(job_url)
+            conditional_headers = {}
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    conditional_headers['If-None-Match'] = etag
+                if last_modified:
+                    conditional_headers['If-Modified-Since'] = last_modified
+            
+            # One request: transient failures (429/5xx) are retried by the session's adapter
+            # with exponential backoff, honouring Retry-After
+            headers = {**_LINKEDIN_HEADERS, 'User-Agent': random.choice(_LINKEDIN_USER_AGENTS), **conditional_headers}
+            self._rate_limiter.wait(base_url)  # spaces back-to-back LinkedIn calls
+            response = self.session.get(
+                base_url,
+                headers=headers,
+                timeout=20,
+                verify=False,
+                allow_redirects=True,
+                stream=True
+            )
+            if response.status_code == 304 and cached:
+                response.close()
+                logger.info("LinkedIn page not modified - using cached details")
+                return cached[2]
+            if response.status_code != 200:
+                response.close()
+                logger.warning(f"LinkedIn request failed with status code: {response.status_code}")
                 return None
             
-            # Successfully got the page
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract job title
-            job_title = None
-            title_selectors = [
-                ('h1', {'class': 'top-card-layout__title'}),
-                ('h2', {'class': 'topcard__title'}),
-                ('h1', {'class': 'topcard__title'}),
-                ('h1', None)
-            ]
-            
-            for tag, attrs in title_selectors:
-                title_elem = soup.find(tag, attrs) if attrs else soup.find(tag)
-                if title_elem:
-                    job_title = title_elem.get_text(strip=True)
-                    break
-            
-            # Extract company name
-            company_name = None
-            company_selectors = [
-                ('a', {'class': 'topcard__org-name-link'}),
-                ('span', {'class': 'topcard__flavor'}),
-                ('a', {'class': 'sub-nav-cta__optional-url'})
-            ]
-            
-            for tag, attrs in company_selectors:
-                company_elem = soup.find(tag, attrs)
-                if company_elem:
-                    company_name = company_elem.get_text(strip=True)
-                    break
-            
-            # Extract job description
-            description = None
-            desc_selectors = [
-                ('div', {'class': 'show-more-less-html__markup'}),
-                ('div', {'class': 'description__text'}),
-                ('section', {'class': 'description'}),
-                ('div', {'class': 'core-section-container__content'})
-            ]
-            
-            for tag, attrs in desc_selectors:
-                desc_elem = soup.find(tag, attrs)
-                if desc_elem:
-                    # Get text and clean up
-                    description = desc_elem.get_text(separator='\n', strip=True)
-                    # Remove excessive whitespace
-                    description = '\n'.join([line.strip() for line in description.split('\n') if line.strip()])
-                    break
+            logger.info("Successfully retrieved LinkedIn page")
+            logger.debug(f"LinkedIn Content-Encoding: {response.headers.get('Content-Encoding')}")
+            html = self._read_job_page(response)
+            if not html:
+                logger.warning("LinkedIn returned an empty page")
+                return None
             
-            # If no structured description found, try to get any visible text
-            if not description:
-                # Look for any div containing substantial text
-                content_divs = soup.find_all('div', {'class': lambda x: x and 'description' in x.lower()})
-                if content_divs:
-                    description = content_divs[0].get_text(separator='\n', strip=True)
+            # Successfully got the page - parse it once
+            job_title, company_name, description = _parse_linkedin_job(html)
             
             # Build result
             if job_title or description:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract job title
-                job_title = None
-                title_selectors = [
-                    ('h1', {'class': 'top-card-layout__title'}),
-                    ('h2', {'class': 'topcard__title'}),
-                    ('h1', {'class': 'topcard__title'}),
-                    ('h1', None)
-                ]
-                
-                for tag, attrs in title_selectors:
-                    title_elem = soup.find(tag, attrs) if attrs else soup.find(tag)
-                    if title_elem:
-                        job_title = title_elem.get_text(strip=True)
-                        break
-                
-                # Extract company name
-                company_name = None
-                company_selectors = [
-                    ('a', {'class': 'topcard__org-name-link'}),
-                    ('span', {'class': 'topcard__flavor'}),
-                    ('a', {'class': 'sub-nav-cta__optional-url'})
-                ]
-                
-                for tag, attrs in company_selectors:
-                    company_elem = soup.find(tag, attrs)
-                    if company_elem:
-                        company_name = company_elem.get_text(strip=True)
-                        break
-                
-                # Extract job description
-                description = None
-                desc_selectors = [
-                    ('div', {'class': 'show-more-less-html__markup'}),
-                    ('div', {'class': 'description__text'}),
-                    ('section', {'class': 'description'}),
-                    ('div', {'class': 'core-section-container__content'})
-                ]
-                
-                for tag, attrs in desc_selectors:
-                    desc_elem = soup.find(tag, attrs)
-                    if desc_elem:
-                        # Get text and clean up
-                        description = desc_elem.get_text(separator='\n', strip=True)
-                        # Remove excessive whitespace
-                        description = '\n'.join([line.strip() for line in description.split('\n') if line.strip()])
-                        break
-                
-                # If no structured description found, try to get any visible text
-                if not description:
-                    # Look for any div containing substantial text
-                    content_divs = soup.find_all('div', {'class': lambda x: x and 'description' in x.lower()})
-                    if content_divs:
-                        description = content_divs[0].get_text(separator='\n', strip=True)
-                
-                # Build result
-                if job_title or description:
-                    return {
-                        'title': job_title or 'LinkedIn Job',
-                        'company': company_name or 'Company',
-                        'description': description or 'Job description extracted from LinkedIn',
-                        'source': 'LinkedIn',
-                        'url': job_url
-                    }
-                else:
-                    logger.warning("Could not extract job details from LinkedIn page")
-                    return None
+                job = JobRecord(
+                    title=job_title or 'LinkedIn Job',
+                    company=company_name or 'Company',
+                    description=description or 'Job description extracted from LinkedIn',
+                    source='LinkedIn',
+                    url=job_url
+                )
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self._etag_cache.set(job_url, (etag, last_modified, job))
+                return job
             else:
-                logger.warning(f"LinkedIn request failed with status code: {response.status_code}")
+                logger.warning("Could not extract job details from LinkedIn page")
                 return None
                 
         except Exception as e:
             logger.error(f"Error scraping LinkedIn URL: {e}")
             return None
     
-    def search_linkedin(self, job_title: str, company: str = "", linkedin_url: Optional[str] = None) -> List[Dict]:
+    @_cached_portal_search
+    def search_linkedin(self, job_title: str, company: str = "", linkedin_url: Optional[str] = None) -> List[JobRecord]:
         """
         Search LinkedIn or scrape a specific LinkedIn job URL.
         
@@ -406,7 +613,7 @@ class JobPortalScraper:
             linkedin_url: Direct LinkedIn job URL (optional)
             
         Returns:
-            List of job dictionaries
+            List of JobRecord results
         """
         jobs = []
         
@@ -422,18 +629,16 @@ class JobPortalScraper:
             logger.info(f"Searching LinkedIn for: {job_title} at {company}")
             
             # Expand company name abbreviations for better search results
-            company_expanded = company
             company_lower = company.lower()
-            if 'mindef' in company_lower or company_lower == 'mod':
-                company_expanded = "Ministry of Defence Singapore"
-            elif 'moe' in company_lower:
-                company_expanded = "Ministry of Education Singapore"
-            elif 'moh' in company_lower:
-                company_expanded = "Ministry of Health Singapore"
+            if company_lower == 'mod':
+                company_expanded = _COMPANY_ABBREVIATIONS['mod']
+            else:
+                match = _COMPANY_ABBREV_RE.search(company_lower)
+                company_expanded = _COMPANY_ABBREVIATIONS[match.group()] if match else company
             
             # Build search query with expanded company name
-            search_query = f"{job_title} {company_expanded}".strip().replace(' ', '%20')
-            search_url = f"https://www.linkedin.com/jobs/search?keywords={search_query}&location=Singapore"
+            search_query = f"{job_title} {company_expanded}".strip()
+            search_url = f"{_LINKEDIN_SEARCH_URL}?{urlencode({'keywords': search_query, 'location': 'Singapore'})}"
             
             logger.info(f"LinkedIn search URL: {search_url}")
             
@@ -442,24 +647,24 @@ class JobPortalScraper:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept-Encoding': ACCEPT_ENCODING,
                 'DNT': '1',
                 'Connection': 'keep-alive',
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            time.sleep(random.uniform(2, 4))  # Random delay
-            response = requests.get(search_url, headers=headers, timeout=15, verify=False, allow_redirects=True)
+            self._rate_limiter.wait(search_url)
+            response = self.session.get(search_url, headers=headers, timeout=15, verify=False, allow_redirects=True)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, _HTML_PARSER)
                 
                 # Look for job cards in the search results
-                job_cards = soup.find_all('div', {'class': lambda x: x and 'job' in x.lower() and 'card' in x.lower()})[:3]
+                job_cards = _LINKEDIN_JOB_CARD_SEL.select(soup, limit=3)
                 
                 if not job_cards:
                     # Try alternative selectors
-                    job_cards = soup.find_all('li', {'class': lambda x: x and 'job' in x.lower()})[:3]
+                    job_cards = _LINKEDIN_JOB_ITEM_SEL.select(soup, limit=3)
                 
                 for card in job_cards:
                     try:
@@ -501,116 +706,130 @@ class JobPortalScraper:
         
         # If search didn't work, return placeholder
         if not jobs:
-            jobs.append({
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"LinkedIn search attempted but no jobs found. Try providing a direct LinkedIn job URL for better results.",
-                'source': 'LinkedIn (Search Limited)'
-            })
+            jobs.append(JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"LinkedIn search attempted but no jobs found. Try providing a direct LinkedIn job URL for better results.",
+                source='LinkedIn (Search Limited)'
+            ))
         
         return jobs
     
-    def search_foundit(self, job_title: str, company: str = "") -> List[Dict]:
+    def search_foundit(self, job_title: str, company: str = "") -> List[JobRecord]:
         """Foundit search (placeholder)."""
-        return [{
-            'title': job_title,
-            'company': company or 'Company',
-            'description': f"Foundit job data for {job_title} - limited access in cloud",
-            'source': 'Foundit'
-        }]
+        return [JobRecord(
+            title=job_title,
+            company=company or 'Company',
+            description=f"Foundit job data for {job_title} - limited access in cloud",
+            source='Foundit'
+        )]
     
-    def search_jobscentral(self, job_title: str, company: str = "") -> List[Dict]:
+    def search_jobscentral(self, job_title: str, company: str = "") -> List[JobRecord]:
         """JobsCentral search (placeholder)."""
-        return [{
-            'title': job_title,
-            'company': company or 'Company',
-            'description': f"JobsCentral data for {job_title} - cloud deployment limitations",
-            'source': 'JobsCentral'
-        }]
+        return [JobRecord(
+            title=job_title,
+            company=company or 'Company',
+            description=f"JobsCentral data for {job_title} - cloud deployment limitations",
+            source='JobsCentral'
+        )]
     
-    def search_all_portals(self, job_title: str, company: str = "", max_results_per_portal: int = 2, linkedin_url: Optional[str] = None) -> List[Dict]:
+    def search_all_portals(self, job_title: str, company: str = "", max_results_per_portal: int = 2, linkedin_url: Optional[str] = None) -> List[JobRecord]:
         """Search all available portals: LinkedIn, Indeed, JobStreet, MyCareersFuture, Careers@Gov."""
         all_jobs = []
         
         # Note: Web scraping is limited in Streamlit Community Cloud
         # This provides basic functionality for demonstration
         
+        # (portal, search method, extra kwargs, result cap) - each portal is a different host,
+        # so they are searched concurrently rather than one after another
+        portals = []
+        if linkedin_url and 'linkedin.com/jobs/view' in linkedin_url:
+            portals.append(('LinkedIn', self.search_linkedin, {'linkedin_url': linkedin_url}, max_results_per_portal))
+        portals += [
+            ('Indeed', self.search_indeed, {}, max_results_per_portal),
+            ('JobStreet', self.search_jobstreet, {}, 1),
+            ('MyCareersFuture', self.search_mycareersfuture, {}, 1),
+            ('Careers@Gov', self.search_careers_gov_sg, {}, 1),
+        ]
+        
+        executor = ThreadPoolExecutor(max_workers=len(portals))
         try:
-            # Search LinkedIn first if URL provided
-            if linkedin_url and 'linkedin.com/jobs/view' in linkedin_url:
-                linkedin_jobs = self.search_linkedin(job_title, company, linkedin_url=linkedin_url)
-                all_jobs.extend(linkedin_jobs[:max_results_per_portal])
-                self._delay()
-            
-            # Search Indeed (most reliable)
-            indeed_jobs = self.search_indeed(job_title, company)
-            all_jobs.extend(indeed_jobs[:max_results_per_portal])
-            self._delay()
-            
-            # Search JobStreet
-            jobstreet_jobs = self.search_jobstreet(job_title, company)
-            all_jobs.extend(jobstreet_jobs[:1])
-            self._delay()
-            
-            # Search MyCareersFuture
-            mycareersfuture_jobs = self.search_mycareersfuture(job_title, company)
-            all_jobs.extend(mycareersfuture_jobs[:1])
-            self._delay()
-            
-            # Search Careers@Gov (Singapore government portal)
-            careers_gov_jobs = self.search_careers_gov_sg(job_title, company)
-            all_jobs.extend(careers_gov_jobs[:1])
-            
+            futures = [executor.submit(search, job_title, company, **kwargs) for _, search, kwargs, _ in portals]
+            # Collect in portal order so LinkedIn/Indeed results stay first
+            for (portal, _, _, cap), future in zip(portals, futures):
+                try:
+                    all_jobs.extend(future.result(timeout=_PORTAL_TIMEOUT_SECONDS)[:cap])
+                except Exception as e:
+                    logger.error(f"Error searching {portal}: {e}")
         except Exception as e:
             logger.error(f"Error in search_all_portals: {e}")
             # Provide fallback data
-            all_jobs = [{
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"Cloud deployment - web scraping limitations. Generating description for {job_title} role.",
-                'source': 'System Generated'
-            }]
+            all_jobs = [JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"Cloud deployment - web scraping limitations. Generating description for {job_title} role.",
+                source='System Generated'
+            )]
+        finally:
+            # Don't block on a portal that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
         
         # Ensure we have at least one result
         if not all_jobs:
-            all_jobs = [{
-                'title': job_title,
-                'company': company or 'Company',
-                'description': f"No web results found. Generating description for {job_title} position at {company}.",
-                'source': 'System Fallback'
-            }]
+            all_jobs = [JobRecord(
+                title=job_title,
+                company=company or 'Company',
+                description=f"No web results found. Generating description for {job_title} position at {company}.",
+                source='System Fallback'
+            )]
         
         return all_jobs[:5]  # Limit total results
     
-    def extract_job_details(self, job_results: List[Dict]) -> str:
+    async def search_all_portals_async(self, job_title: str, company: str = "", max_results_per_portal: int = 2,
+                                       linkedin_url: Optional[str] = None) -> List[JobRecord]:
+        """Awaitable search_all_portals; the portal fan-out runs on worker threads, off the event loop."""
+        return await asyncio.to_thread(self.search_all_portals, job_title, company, max_results_per_portal, linkedin_url)
+    
+    def extract_job_details(self, job_results: List[JobRecord]) -> str:
         """Extract and format job details for AI processing."""
         if not job_results:
             return "No job market data available. Generating description from input only."
         
-        formatted_results = []
-        for idx, job in enumerate(job_results[:3], 1):  # Limit to top 3
-            formatted_results.append(
-                f"Job {idx}:\n"
-                f"Title: {job.get('title', 'N/A')}\n"
-                f"Company: {job.get('company', 'N/A')}\n"
-                f"Description: {job.get('description', 'N/A')}\n"
-                f"Source: {job.get('source', 'N/A')}"
-            )
-        
-        return "\n\n---\n\n".join(formatted_results)
+        return _format_job_details(tuple(job_results[:3]))  # Limit to top 3
     
     def get_job_suggestions(self, job_title: str, company: str = "") -> List[str]:
         """Get job suggestions based on search results."""
         try:
             results = self.search_all_portals(job_title, company, max_results_per_portal=1)
-            suggestions = []
-            
-            for job in results:
-                if job.get('title') and job['title'] not in suggestions:
-                    suggestions.append(job['title'])
-            
+            # dict.fromkeys de-duplicates in first-seen order
+            suggestions = list(dict.fromkeys(job.title for job in results if job.title))
             return suggestions[:5]  # Return top 5 suggestions
             
         except Exception as e:
             logger.error(f"Error getting job suggestions: {e}")
-            return [job_title]  # Return original title as fallback
\ No newline at end of file
+            return [job_title]  # Return original title as fallback
+    
+    def get_job_suggestions_bulk(self, queries: List[Tuple[str, str]], concurrency: int = 4) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Get job suggestions for many (job_title, company) pairs at once.
+        
+        Args:
+            queries: List of (job_title, company) tuples
+            concurrency: Maximum number of searches in flight at once (each fans out over the portals)
+            
+        Returns:
+            Dictionary mapping each (job_title, company) query to its suggestions
+        """
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(queries)))) as executor:
+            # executor.map preserves input order
+            suggestions = executor.map(lambda query: self.get_job_suggestions(*query), queries)
+            return dict(zip(queries, suggestions))
+    
+    async def get_job_suggestions_bulk_async(self, queries: List[Tuple[str, str]],
+                                             concurrency: int = 4) -> Dict[Tuple[str, str], List[str]]:
+        """Awaitable get_job_suggestions_bulk; the searches run on worker threads, off the event loop."""
+        return await asyncio.to_thread(self.get_job_suggestions_bulk, queries, concurrency)
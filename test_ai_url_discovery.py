@@ -4,7 +4,7 @@ This test verifies that the system can discover LinkedIn job URLs
 through intelligent web search WITHOUT hard-coding.
 """
 
-from scraper import JobPortalScraper
+from scraper import JobPortalScraper, _linkedin_job_id
 import logging
 
 # Enable detailed logging
@@ -13,6 +13,12 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message
 # Initialize scraper
 scraper = JobPortalScraper()
 
+# Result fields read by the report loops, fetched in one pass per result
+_KEYS = ('title', 'company', 'source', 'url', 'description')
+
+# LinkedIn posting IDs that count as finding the exact job
+EXPECTED_IDS = frozenset({'4341315847'})
+
 # Test parameters - NO URL, NO HARD-CODING
 company = "Mindef"
 job_title = "Manager (Museum Development & Governance)"
@@ -83,13 +89,14 @@ results = scraper.search_linkedin(job_title, company, linkedin_url=None, api_key
 
 if results:
     for idx, result in enumerate(results, 1):
+        title, org, source, url, _ = map(result.get, _KEYS)
         print(f"\n📋 Result {idx}:")
-        print(f"   Title: {result.get('title', 'N/A')}")
-        print(f"   Company: {result.get('company', 'N/A')}")
-        print(f"   Source: {result.get('source', 'N/A')}")
-        if 'url' in result and result['url']:
-            print(f"   URL: {result['url'][:100]}...")
-            if '4341315847' in result.get('url', ''):
+        print(f"   Title: {title or 'N/A'}")
+        print(f"   Company: {org or 'N/A'}")
+        print(f"   Source: {source or 'N/A'}")
+        if url:
+            print(f"   URL: {url[:100]}...")
+            if _linkedin_job_id(url) in EXPECTED_IDS:
                 print("   ✅ FOUND THE EXACT JOB!")
 
 print("\n" + "=" * 80)
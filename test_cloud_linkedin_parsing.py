@@ -0,0 +1,143 @@
+"""
+Test LinkedIn job page parsing in the cloud scraper against a recorded page (no network needed)
+"""
+
+import pytest
+
+import scraper_cloud
+
+# Trimmed copy of a LinkedIn guest job page: top card, description, and unrelated page chrome
+RECORDED_JOB_PAGE = b"""<!DOCTYPE html>
+<html lang="en">
+<head><title>Manager (Museum Development) | Ministry of Defence of Singapore | LinkedIn</title></head>
+<body>
+  <nav class="nav"><a href="/">LinkedIn</a><a class="nav__button-secondary" href="/login">Sign in</a></nav>
+  <section class="top-card-layout container-lined overflow-hidden babybear:rounded-[0px]">
+    <div class="top-card-layout__entity-info-container">
+      <h1 class="top-card-layout__title font-sans text-lg">Manager (Museum Development &amp; Governance)</h1>
+      <h4 class="top-card-layout__second-subline">
+        <span class="topcard__flavor">
+          <a class="topcard__org-name-link topcard__flavor--black-link" href="https://sg.linkedin.com/company/mindef">
+            Ministry of Defence of Singapore
+          </a>
+        </span>
+        <span class="topcard__flavor topcard__flavor--bullet">Singapore</span>
+      </h4>
+    </div>
+  </section>
+  <section class="core-section-container my-3 description">
+    <div class="description__text description__text--rich">
+      <section class="show-more-less-html">
+        <div class="show-more-less-html__markup relative overflow-hidden">
+          <strong>What you will do</strong><br><br>
+          Plan and manage museum development projects.
+
+          <ul><li>Develop governance frameworks</li>   <li>Coordinate with stakeholders</li></ul>
+        </div>
+      </section>
+    </div>
+  </section>
+  <section class="similar-jobs"><h2 class="similar-jobs__header">Similar jobs</h2></section>
+</body>
+</html>"""
+
+
+# Job page whose only title is a plain <h1> (no top-card classes)
+PLAIN_H1_JOB_PAGE = b"""<html><body>
+  <h1>Data Analyst</h1>
+  <div class="show-more-less-html__markup">Analyse service data.</div>
+</body></html>"""
+
+# Top-priority description block is empty; the text sits in a later "description" div
+EMPTY_DESCRIPTION_JOB_PAGE = b"""<html><body>
+  <h1 class="top-card-layout__title">Data Analyst</h1>
+  <a class="topcard__org-name-link">GovTech</a>
+  <div class="show-more-less-html__markup">   </div>
+  <div class="job-description">Fallback text</div>
+</body></html>"""
+
+
+@pytest.fixture(params=['lxml', 'bs4'])
+def parse_linkedin_job(request, monkeypatch):
+    """_parse_linkedin_job on the direct lxml path and on the BeautifulSoup fallback path."""
+    if request.param == 'bs4':
+        monkeypatch.setattr(scraper_cloud, 'etree', None)
+    return scraper_cloud._parse_linkedin_job
+
+
+def test_parse_recorded_linkedin_page(parse_linkedin_job):
+    """Title, company and cleaned-up description are extracted from a single parse."""
+    title, company, description = parse_linkedin_job(RECORDED_JOB_PAGE)
+
+    print("=" * 80)
+    print("Testing cloud LinkedIn job page parsing")
+    print("=" * 80)
+    print(f"Title: {title}")
+    print(f"Company: {company}")
+    print(f"Description:\n{description}")
+
+    assert title == "Manager (Museum Development & Governance)"
+    assert company == "Ministry of Defence of Singapore"
+    assert description == (
+        "What you will do\n"
+        "Plan and manage museum development projects.\n"
+        "Develop governance frameworks\n"
+        "Coordinate with stakeholders"
+    )
+    print("\n✅ Parsed job details match the recorded page")
+
+
+def test_parse_plain_h1_title(parse_linkedin_job):
+    """A plain <h1> is the last-resort title selector."""
+    title, company, description = parse_linkedin_job(PLAIN_H1_JOB_PAGE)
+
+    assert title == "Data Analyst"
+    assert company is None
+    assert description == "Analyse service data."
+    print("✅ Plain <h1> title extracted")
+
+
+def test_parse_empty_description_block(parse_linkedin_job):
+    """An empty top description block falls back to the first "description" div."""
+    assert parse_linkedin_job(EMPTY_DESCRIPTION_JOB_PAGE) == ("Data Analyst", "GovTech", "Fallback text")
+    print("✅ Empty description block falls back to the description div")
+
+
+class _StreamedResponse:
+    """Stand-in for a streamed requests.Response: the body arrives in small chunks."""
+
+    def __init__(self, body: bytes, chunk_size: int = 32):
+        self.body, self.chunk_size, self.closed = body, chunk_size, False
+
+    def iter_content(self, _chunk_size):
+        return (self.body[i:i + self.chunk_size] for i in range(0, len(self.body), self.chunk_size))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.skipif(scraper_cloud.etree is None, reason="early stop needs lxml")
+def test_streamed_page_reads_past_empty_description_block():
+    """The streamed read doesn't stop at an empty description block, only once the fallback div has text."""
+    page = EMPTY_DESCRIPTION_JOB_PAGE.replace(b"</body>", b"<footer>" + b"x" * 4096 + b"</footer></body>")
+    response = _StreamedResponse(page)
+    body = scraper_cloud.JobPortalScraper()._read_job_page(response)
+
+    assert response.closed
+    assert len(body) < len(page)
+    assert scraper_cloud._parse_linkedin_job(body)[2] == "Fallback text"
+    print("✅ Streamed read stops after the fallback description")
+
+
+def test_parse_page_without_job_details(parse_linkedin_job):
+    """A page with none of the known sections yields no fields."""
+    assert parse_linkedin_job(b"<html><body><p>Sign in to view this job</p></body></html>") == (None, None, None)
+    print("✅ Page without job details yields no fields")
+
+
+if __name__ == "__main__":
+    test_parse_recorded_linkedin_page(scraper_cloud._parse_linkedin_job)
+    test_parse_plain_h1_title(scraper_cloud._parse_linkedin_job)
+    test_parse_empty_description_block(scraper_cloud._parse_linkedin_job)
+    test_streamed_page_reads_past_empty_description_block()
+    test_parse_page_without_job_details(scraper_cloud._parse_linkedin_job)
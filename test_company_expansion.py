@@ -0,0 +1,23 @@
+"""
+Test company abbreviation expansion and government detection (no network needed)
+"""
+import pytest
+
+from scraper import _classify_company_cached
+
+
+@pytest.mark.parametrize('company, expected', [
+    ("MINDEF", ("Ministry of Defence Singapore", True)),
+    ("mod", ("Ministry of Defence Singapore", True)),
+    ("LTA Singapore", ("Land Transport Authority Singapore", True)),
+    ("Ministry of Health", ("Ministry of Health", True)),
+])
+def test_government_companies(company, expected):
+    """Whole-word abbreviations expand; government names are flagged."""
+    assert _classify_company_cached(company) == expected
+
+
+@pytest.mark.parametrize('company', ["Delta Air Lines", "Moeller Group", "HDBank", "Modern Retail"])
+def test_abbreviation_inside_a_word(company):
+    """An abbreviation buried in an ordinary name neither renames the company nor flags it as government."""
+    assert _classify_company_cached(company) == (company, False)
@@ -4,8 +4,9 @@ This test verifies that the system can automatically find the correct LinkedIn j
 without the user needing to paste the URL.
 """
 
-from scraper import JobPortalScraper
+from scraper import JobPortalScraper, _linkedin_job_id
 import logging
+import sys
 
 # Enable detailed logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -13,10 +14,14 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message
 # Initialize scraper
 scraper = JobPortalScraper()
 
+# Result fields read by the report loops, fetched in one pass per result
+_KEYS = ('title', 'company', 'source', 'url', 'description')
+
 # Test parameters - NO URL PROVIDED
 company = "Mindef"
 job_title = "Manager (Museum Development & Governance)"
 expected_job_id = "4341315847"  # This is what we're looking for
+EXPECTED_IDS = frozenset({expected_job_id})
 
 print("=" * 80)
 print("ENHANCED TEST: Intelligent LinkedIn Job Search")
@@ -42,34 +47,41 @@ print("=" * 80)
 
 if results:
     for idx, result in enumerate(results, 1):
-        print(f"\n📋 Result {idx}:")
-        print(f"   Title: {result.get('title', 'N/A')}")
-        print(f"   Company: {result.get('company', 'N/A')}")
-        print(f"   Source: {result.get('source', 'N/A')}")
+        title, org, source, url, desc = map(result.get, _KEYS)
+        # One write per result instead of a print per line
+        lines = [
+            f"\n📋 Result {idx}:",
+            f"   Title: {title or 'N/A'}",
+            f"   Company: {org or 'N/A'}",
+            f"   Source: {source or 'N/A'}",
+        ]
         
-        if 'url' in result and result['url']:
-            url = result['url']
-            print(f"   URL: {url}")
+        if url:
+            lines.append(f"   URL: {url}")
             
             # Check if this is the correct job
-            if expected_job_id in url:
-                print("\n   ✅✅✅ SUCCESS! Found the correct job automatically!")
-                print(f"   ✅ Job ID {expected_job_id} matches!")
-                print(f"   ✅ User did NOT need to paste URL!")
-                print(f"   ✅ System searched and found it intelligently!")
+            if _linkedin_job_id(url) in EXPECTED_IDS:
+                lines += [
+                    "\n   ✅✅✅ SUCCESS! Found the correct job automatically!",
+                    f"   ✅ Job ID {expected_job_id} matches!",
+                    "   ✅ User did NOT need to paste URL!",
+                    "   ✅ System searched and found it intelligently!",
+                ]
             else:
-                print(f"\n   ⚠️  Different job found (Job ID doesn't match)")
-                print(f"   Expected: {expected_job_id}")
-                print(f"   Got: Different job")
+                lines += [
+                    "\n   ⚠️  Different job found (Job ID doesn't match)",
+                    f"   Expected: {expected_job_id}",
+                    "   Got: Different job",
+                ]
         else:
-            print(f"   URL: Not available")
+            lines.append("   URL: Not available")
         
         # Show description preview
-        desc = result.get('description', '')
         if desc and len(desc) > 100:
-            print(f"\n   Description preview: {desc[:200]}...")
+            lines.append(f"\n   Description preview: {desc[:200]}...")
         elif desc:
-            print(f"\n   Description: {desc}")
+            lines.append(f"\n   Description: {desc}")
+        sys.stdout.write("\n".join(lines) + "\n")
 else:
     print("❌ No results returned")
 
@@ -79,7 +91,7 @@ print("=" * 80)
 
 # Provide interpretation
 print("\n📊 INTERPRETATION:")
-if results and any(expected_job_id in r.get('url', '') for r in results):
+if results and any(_linkedin_job_id(r.get('url')) in EXPECTED_IDS for r in results):
     print("✅ PASS: System successfully found the exact job through intelligent search!")
     print("   → Users don't need to paste LinkedIn URLs")
     print("   → Auto-search with company name expansion works!")
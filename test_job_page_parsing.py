@@ -0,0 +1,56 @@
+"""
+Test job page parsing in the scraper against recorded pages (no network needed)
+"""
+
+# Plain <h1> title, with a class-named title element elsewhere on the page
+PLAIN_H1_PAGE = b"""<!DOCTYPE html>
+<html lang="en">
+<body>
+  <main>
+    <h1>Data Analyst</h1>
+    <div class="job-description">
+      Analyse service data and prepare monthly reports for management.
+      Work with agency teams to improve data quality and build dashboards for operations.
+    </div>
+  </main>
+  <aside><div class="job-title">Sidebar</div></aside>
+</body>
+</html>"""
+
+
+def test_careers_gov_plain_h1_title(scraper, monkeypatch):
+    """A plain <h1> is the first career@gov title selector and survives the parse strainer."""
+    monkeypatch.setattr(scraper, '_fetch_html', lambda url, timeout=5: PLAIN_H1_PAGE)
+    job = scraper._scrape_careers_gov_job("https://jobs.careers.gov.sg/job/1", "GovTech", "Analyst")
+
+    print(f"Title: {job.title}")
+    assert job.title == "Data Analyst"
+    assert job.description.startswith("Analyse service data")
+
+
+def test_linkedin_plain_h1_title(scraper, monkeypatch):
+    """LinkedIn pages without the top-card classes fall back to the plain <h1> title."""
+    monkeypatch.setattr(scraper, '_fetch_html', lambda url, timeout=5: PLAIN_H1_PAGE)
+    job = scraper._scrape_linkedin_fast("https://www.linkedin.com/jobs/view/1234567890")
+
+    print(f"Title: {job.title}")
+    assert job.title == "Data Analyst"
+
+
+def test_linkedin_url_plain_h1_title(scraper, monkeypatch):
+    """A directly scraped LinkedIn URL keeps its plain <h1> title instead of the 'LinkedIn Job' placeholder."""
+    monkeypatch.setattr(scraper, '_stream_html', lambda url, timeout, headers=None, session=None: PLAIN_H1_PAGE)
+    job = scraper._scrape_linkedin_job_url_uncached("https://www.linkedin.com/jobs/view/1234567890")
+
+    print(f"Title: {job.title}")
+    assert job.title == "Data Analyst"
+
+
+def test_linkedin_url_description_blank_lines(scraper, monkeypatch):
+    """CRLF and &nbsp;-only lines in a description collapse like plain blank lines."""
+    page = (b'<html><body><h1>Data Analyst</h1><div class="show-more-less-html__markup">'
+            b'Analyse data\r\n&nbsp;\r\n  Build dashboards</div></body></html>')
+    monkeypatch.setattr(scraper, '_stream_html', lambda url, timeout, headers=None, session=None: page)
+    job = scraper._scrape_linkedin_job_url_uncached("https://www.linkedin.com/jobs/view/1234567890")
+
+    assert job.description == "Analyse data\nBuild dashboards"
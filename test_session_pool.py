@@ -0,0 +1,46 @@
+"""
+Test the LinkedIn session pool's checkout/release bookkeeping (no network needed)
+"""
+import threading
+
+import scraper
+from scraper import _SessionPool
+
+
+def test_sessions_are_checked_out_exclusively():
+    """No session is handed to two holders at once, even with more threads than slots."""
+    pool = _SessionPool('test-exclusive', size=2)
+    lock = threading.Lock()
+    held, shared = set(), []
+
+    def work():
+        for _ in range(20):
+            session = pool.acquire()
+            with lock:
+                if session in held:
+                    shared.append(session)
+                held.add(session)
+            with lock:
+                held.discard(session)
+            pool.release(session, ok=True)
+
+    threads = [threading.Thread(target=work) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not shared
+
+
+def test_blocked_session_is_replaced_and_its_cookies_deleted():
+    """A session released as blocked is dropped, along with its persisted cookies."""
+    pool = _SessionPool('test-blocked', size=1)
+    session = pool.acquire()
+    pool.release(session, ok=True)
+    assert scraper._SEARCH_CACHE.get(('session_cookies', 'test-blocked', 0)) is not None
+
+    assert pool.acquire() is session
+    pool.release(session, ok=False)
+    assert scraper._SEARCH_CACHE.get(('session_cookies', 'test-blocked', 0)) is None
+    assert pool.acquire() is not session
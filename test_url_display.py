@@ -2,11 +2,19 @@
 Test script to verify URL source display for Ministry of Defence job posting
 """
 
-from scraper import JobPortalScraper
+import sys
+
+from scraper import JobPortalScraper, _linkedin_job_id
 
 # Initialize scraper
 scraper = JobPortalScraper()
 
+# Result fields read by the report loops, fetched in one pass per result
+_KEYS = ('title', 'company', 'source', 'url', 'description')
+
+# LinkedIn posting IDs that count as the correct job
+EXPECTED_IDS = frozenset({'4341315847'})
+
 # Test parameters
 company = "Mindef"
 job_title = "Manager (Museum Development & Governance)"
@@ -27,21 +35,26 @@ linkedin_results = scraper.search_linkedin(job_title, company, linkedin_url=link
 
 if linkedin_results:
     for idx, result in enumerate(linkedin_results, 1):
-        print(f"\nResult {idx}:")
-        print(f"  Title: {result.get('title', 'N/A')}")
-        print(f"  Company: {result.get('company', 'N/A')}")
-        print(f"  Source: {result.get('source', 'N/A')}")
-        print(f"  URL: {result.get('url', 'N/A')}")
-        print(f"  Description (first 200 chars): {result.get('description', 'N/A')[:200]}...")
+        title, org, source, url, desc = map(result.get, _KEYS)
+        # One write per result instead of a print per line
+        lines = [
+            f"\nResult {idx}:",
+            f"  Title: {title or 'N/A'}",
+            f"  Company: {org or 'N/A'}",
+            f"  Source: {source or 'N/A'}",
+            f"  URL: {url or 'N/A'}",
+            f"  Description (first 200 chars): {(desc or 'N/A')[:200]}...",
+        ]
         
         # Check if URL matches
-        if 'url' in result and result['url']:
-            if '4341315847' in result['url']:
-                print("  ✅ URL CONTAINS CORRECT JOB ID!")
+        if url:
+            if _linkedin_job_id(url) in EXPECTED_IDS:
+                lines.append("  ✅ URL CONTAINS CORRECT JOB ID!")
             else:
-                print(f"  ⚠️  URL doesn't match expected job ID")
+                lines.append("  ⚠️  URL doesn't match expected job ID")
         else:
-            print("  ❌ NO URL FOUND!")
+            lines.append("  ❌ NO URL FOUND!")
+        sys.stdout.write("\n".join(lines) + "\n")
 else:
     print("❌ No results returned from LinkedIn scraping")
 
@@ -53,16 +66,15 @@ auto_search_results = scraper.search_linkedin(job_title, company, linkedin_url=N
 
 if auto_search_results:
     for idx, result in enumerate(auto_search_results, 1):
-        print(f"\nResult {idx}:")
-        print(f"  Title: {result.get('title', 'N/A')}")
-        print(f"  Company: {result.get('company', 'N/A')}")
-        print(f"  Source: {result.get('source', 'N/A')}")
-        print(f"  URL: {result.get('url', 'N/A')}")
-        
-        if 'url' in result and result['url']:
-            print("  ✅ URL PRESENT")
-        else:
-            print("  ⚠️  NO URL")
+        title, org, source, url, _ = map(result.get, _KEYS)
+        sys.stdout.write("\n".join([
+            f"\nResult {idx}:",
+            f"  Title: {title or 'N/A'}",
+            f"  Company: {org or 'N/A'}",
+            f"  Source: {source or 'N/A'}",
+            f"  URL: {url or 'N/A'}",
+            "  ✅ URL PRESENT" if url else "  ⚠️  NO URL",
+        ]) + "\n")
 else:
     print("❌ No results from auto-search")
 
@@ -73,12 +85,15 @@ print("-" * 80)
 all_results = scraper.search_all_portals(job_title, company)
 
 print(f"\nTotal results from all portals: {len(all_results)}")
+lines = []
 for idx, result in enumerate(all_results, 1):
-    print(f"\n{idx}. {result.get('source', 'Unknown')}")
-    if 'url' in result and result['url']:
-        print(f"   ✅ URL: {result['url'][:100]}...")
+    _, _, source, url, _ = map(result.get, _KEYS)
+    lines.append(f"\n{idx}. {source or 'Unknown'}")
+    if url:
+        lines.append(f"   ✅ URL: {url[:100]}...")
     else:
-        print(f"   ⚠️  No URL")
+        lines.append("   ⚠️  No URL")
+sys.stdout.write("".join(line + "\n" for line in lines))
 
 print("\n" + "=" * 80)
 print("TEST COMPLETE")
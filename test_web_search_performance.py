@@ -1,17 +1,120 @@
 """
 Test script to verify web search functionality and performance.
-Tests the new AI-powered web search context feature.
+Times the intelligent job URL search, the LinkedIn search and generation for a few cases.
 """
 
+import asyncio
+import re
+import sys
 import time
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import pytest
 from scraper import JobPortalScraper
 from generator import JobDescriptionGenerator
+from conftest import API_KEY
 
-load_dotenv()
+# Hits the live network - skipped unless pytest is run with --runnetwork
+pytestmark = pytest.mark.network
 
-def test_web_search_performance():
+# Company names that count as a correct (government/defence) match for the Mindef search
+_GOV_COMPANY_RE = re.compile(
+    '|'.join(map(re.escape, ['ministry', 'defence', 'defense', 'government', 'armed forces', 'mindef'])),
+    re.IGNORECASE
+)
+
+def _web_context(scraper, company, job_title, api_key):
+    """Web context for generation, built as the app does: the best posting from the intelligent job URL search."""
+    return scraper.extract_job_details([scraper.intelligent_job_url_search(company, job_title, api_key)])
+
+
+async def _timed(func, *args, **kwargs):
+    """Run a blocking call in a worker thread; returns (result, seconds taken)."""
+    start_ns = time.perf_counter_ns()
+    result = await asyncio.to_thread(func, *args, **kwargs)
+    return result, (time.perf_counter_ns() - start_ns) / 1e9
+
+
+async def _run_case(scraper, generator, api_key, idx, test_case):
+    """One test case's web search + LinkedIn (overlapped) and generation phases; returns (report lines, total seconds)."""
+    company = test_case['company']
+    job_title = test_case['job_title']
+    lines = [
+        f"\n{'=' * 80}",
+        f"TEST CASE {idx}: {company} - {job_title}",
+        f"Description: {test_case['description']}",
+        "=" * 80,
+    ]
+    
+    # Steps 1 and 2 are independent: run the web search and LinkedIn search together,
+    # joining only before generation, which consumes both
+    web_task = asyncio.create_task(_timed(_web_context, scraper, company, job_title, api_key))
+    linkedin_task = asyncio.create_task(_timed(scraper.search_linkedin, job_title, company, api_key=api_key))
+    (web_context, web_search_time), (linkedin_results, linkedin_time) = await asyncio.gather(web_task, linkedin_task)
+    
+    # Test 1: Web Search Context
+    lines.append("\n📋 Step 1: Web Search Context")
+    lines.append(f"⏱️  Time taken: {web_search_time:.2f} seconds")
+    if web_context:
+        lines.append(f"✅ Found web context ({len(web_context)} characters)")
+        lines.append(f"📄 Preview: {web_context[:150]}...")
+    else:
+        lines.append("⚠️  No web context found")
+    
+    # Test 2: LinkedIn Search with AI Filtering
+    lines.append("\n📋 Step 2: LinkedIn Search with AI Filtering")
+    lines.append(f"⏱️  Time taken: {linkedin_time:.2f} seconds")
+    if linkedin_results:
+        lines.append(f"✅ Found {len(linkedin_results)} LinkedIn result(s)")
+        for result in linkedin_results:
+            lines.append(f"   - {result.get('company', 'Unknown')} - {result.get('title', 'Unknown')}")
+            if 'url' in result:
+                lines.append(f"   - URL: {result['url'][:60]}...")
+    else:
+        lines.append("⚠️  No LinkedIn results")
+    
+    # Test 3: Full Job Description Generation
+    lines.append("\n📋 Step 3: Job Description Generation")
+    start_ns = time.perf_counter_ns()
+    
+    # Combine web context with portal results
+    portal_text = scraper.extract_job_details(linkedin_results) if linkedin_results else ""
+    combined_text = f"{web_context}\n\n---\n\n{portal_text}" if web_context else portal_text
+    
+    generated_desc = await asyncio.to_thread(
+        generator.generate_job_description,
+        company=company,
+        job_title=job_title,
+        initial_description="",
+        web_search_results=combined_text
+    )
+    generation_time = (time.perf_counter_ns() - start_ns) / 1e9
+    
+    lines.append(f"⏱️  Time taken: {generation_time:.2f} seconds")
+    lines.append(f"✅ Generated description ({len(generated_desc)} characters)")
+    
+    # Total time for this test case (steps 1 and 2 overlap, so the slower of the two counts)
+    test_total = max(web_search_time, linkedin_time) + generation_time
+    lines.append(f"\n📊 TOTAL TIME FOR TEST {idx}: {test_total:.2f} seconds")
+    
+    # Performance evaluation
+    if test_total < 15:
+        lines.append("✅ PERFORMANCE: EXCELLENT (< 15 seconds)")
+    elif test_total < 30:
+        lines.append("⚠️  PERFORMANCE: ACCEPTABLE (15-30 seconds)")
+    else:
+        lines.append("❌ PERFORMANCE: SLOW (> 30 seconds) - Needs optimization!")
+    return lines, test_total
+
+
+def _run_case_in_process(idx, test_case, api_key):
+    """Run one test case in a worker process with its own scraper, generator and connection pools."""
+    scraper = JobPortalScraper()
+    generator = JobDescriptionGenerator(api_key=api_key)
+    return asyncio.run(_run_case(scraper, generator, api_key, idx, test_case))
+
+
+def test_web_search_performance(api_key):
     """Test web search context feature with performance metrics."""
     
     print("=" * 80)
@@ -37,144 +140,83 @@ def test_web_search_performance():
         }
     ]
     
-    api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         print("❌ ERROR: OPENAI_API_KEY not found in environment")
         return
     
-    scraper = JobPortalScraper()
-    generator = JobDescriptionGenerator(api_key=api_key)
+    # Cases are independent pipelines: one process each, so the CPU-bound classification that
+    # follows every generation doesn't serialize on the GIL; reports come back in case order
+    start_ns = time.perf_counter_ns()
+    with ProcessPoolExecutor(max_workers=len(test_cases)) as executor:
+        case_reports = list(executor.map(
+            _run_case_in_process, range(1, len(test_cases) + 1), test_cases, repeat(api_key)
+        ))
+    wall_time = (time.perf_counter_ns() - start_ns) / 1e9
     
     total_time = 0
-    
-    for idx, test_case in enumerate(test_cases, 1):
-        print(f"\n{'=' * 80}")
-        print(f"TEST CASE {idx}: {test_case['company']} - {test_case['job_title']}")
-        print(f"Description: {test_case['description']}")
-        print("=" * 80)
-        
-        company = test_case['company']
-        job_title = test_case['job_title']
-        
-        # Test 1: Web Search Context
-        print("\n📋 Step 1: Web Search Context")
-        start_time = time.time()
-        web_context = scraper.web_search_job_context(company, job_title, api_key)
-        web_search_time = time.time() - start_time
-        
-        print(f"⏱️  Time taken: {web_search_time:.2f} seconds")
-        if web_context:
-            print(f"✅ Found web context ({len(web_context)} characters)")
-            print(f"📄 Preview: {web_context[:150]}...")
-        else:
-            print("⚠️  No web context found")
-        
-        # Test 2: LinkedIn Search with AI Filtering
-        print("\n📋 Step 2: LinkedIn Search with AI Filtering")
-        start_time = time.time()
-        linkedin_results = scraper.search_linkedin(job_title, company, api_key=api_key)
-        linkedin_time = time.time() - start_time
-        
-        print(f"⏱️  Time taken: {linkedin_time:.2f} seconds")
-        if linkedin_results:
-            print(f"✅ Found {len(linkedin_results)} LinkedIn result(s)")
-            for result in linkedin_results:
-                print(f"   - {result.get('company', 'Unknown')} - {result.get('title', 'Unknown')}")
-                if 'url' in result:
-                    print(f"   - URL: {result['url'][:60]}...")
-        else:
-            print("⚠️  No LinkedIn results")
-        
-        # Test 3: Full Job Description Generation
-        print("\n📋 Step 3: Job Description Generation")
-        start_time = time.time()
-        
-        # Combine web context with portal results
-        portal_text = scraper.extract_job_details(linkedin_results) if linkedin_results else ""
-        combined_text = f"{web_context}\n\n---\n\n{portal_text}" if web_context else portal_text
-        
-        generated_desc = generator.generate_job_description(
-            company=company,
-            job_title=job_title,
-            initial_description="",
-            web_search_results=combined_text
-        )
-        generation_time = time.time() - start_time
-        
-        print(f"⏱️  Time taken: {generation_time:.2f} seconds")
-        print(f"✅ Generated description ({len(generated_desc)} characters)")
-        
-        # Total time for this test case
-        test_total = web_search_time + linkedin_time + generation_time
+    # Each case's buffered report goes out in one write
+    for lines, test_total in case_reports:
+        sys.stdout.write("\n".join(lines) + "\n")
         total_time += test_total
-        
-        print(f"\n📊 TOTAL TIME FOR TEST {idx}: {test_total:.2f} seconds")
-        
-        # Performance evaluation
-        if test_total < 15:
-            print("✅ PERFORMANCE: EXCELLENT (< 15 seconds)")
-        elif test_total < 30:
-            print("⚠️  PERFORMANCE: ACCEPTABLE (15-30 seconds)")
-        else:
-            print("❌ PERFORMANCE: SLOW (> 30 seconds) - Needs optimization!")
     
     # Final summary
-    print(f"\n{'=' * 80}")
-    print("PERFORMANCE SUMMARY")
-    print("=" * 80)
     avg_time = total_time / len(test_cases)
-    print(f"Total time for all tests: {total_time:.2f} seconds")
-    print(f"Average time per test: {avg_time:.2f} seconds")
-    
     if avg_time < 15:
-        print("✅ OVERALL: FAST - Ready for production!")
+        verdict = "✅ OVERALL: FAST - Ready for production!"
     elif avg_time < 25:
-        print("⚠️  OVERALL: ACCEPTABLE - Could be optimized")
+        verdict = "⚠️  OVERALL: ACCEPTABLE - Could be optimized"
     else:
-        print("❌ OVERALL: TOO SLOW - Needs optimization!")
-    
-    print("\n" + "=" * 80)
-    print("TEST COMPLETE")
-    print("=" * 80)
+        verdict = "❌ OVERALL: TOO SLOW - Needs optimization!"
+    
+    sys.stdout.write("\n".join([
+        f"\n{'=' * 80}",
+        "PERFORMANCE SUMMARY",
+        "=" * 80,
+        f"Total time for all tests: {total_time:.2f} seconds",
+        f"Wall time (cases run in parallel): {wall_time:.2f} seconds",
+        f"Average time per test: {avg_time:.2f} seconds",
+        verdict,
+        "\n" + "=" * 80,
+        "TEST COMPLETE",
+        "=" * 80,
+    ]) + "\n")
 
 
-def test_ai_filtering():
+def test_ai_filtering(scraper, api_key):
     """Test that AI filtering correctly rejects wrong companies."""
     
     print("\n" + "=" * 80)
     print("AI FILTERING TEST - Verify correct company matching")
     print("=" * 80)
     
-    api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         print("❌ ERROR: OPENAI_API_KEY not found")
         return
     
-    scraper = JobPortalScraper()
-    
     # Test: Search for Mindef job - should NOT return LEGO/Netflix jobs
     print("\nTest: Searching for 'Mindef' + 'Manager'")
     print("Expected: Should reject LEGO, Netflix, other non-government jobs")
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     results = scraper.search_linkedin("Manager", "Mindef", api_key=api_key)
-    elapsed = time.time() - start_time
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
     
     print(f"⏱️  Time: {elapsed:.2f} seconds")
     
     if results:
+        lines = []
         for result in results:
             company = result.get('company', 'Unknown')
-            print(f"\n✅ Result: {company}")
+            lines.append(f"\n✅ Result: {company}")
             
             # Check if it's a government/defense related company
-            gov_keywords = ['ministry', 'defence', 'defense', 'government', 'armed forces', 'mindef']
-            is_relevant = any(keyword in company.lower() for keyword in gov_keywords)
+            is_relevant = bool(_GOV_COMPANY_RE.search(company))
             
             if is_relevant:
-                print(f"   ✅ CORRECT: Government/defense related company")
+                lines.append("   ✅ CORRECT: Government/defense related company")
             else:
-                print(f"   ❌ WRONG: Not related to Mindef - AI filtering failed!")
+                lines.append("   ❌ WRONG: Not related to Mindef - AI filtering failed!")
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         print("⚠️  No results returned (AI correctly determined no match)")
         print("   This is acceptable - means no Mindef jobs found on LinkedIn")
@@ -184,7 +226,7 @@ def test_ai_filtering():
 
 if __name__ == "__main__":
     # Run performance tests
-    test_web_search_performance()
+    test_web_search_performance(API_KEY)
     
     # Run AI filtering test
-    test_ai_filtering()
+    test_ai_filtering(JobPortalScraper(), API_KEY)
@@ -2,10 +2,27 @@
 Utility functions for validation, error handling, and helper operations.
 """
 
-import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, Optional
 import pandas as pd
 
+# Friendly messages for common API error types (format_error_message)
+_ERROR_MAPPINGS = MappingProxyType({
+    'AuthenticationError': 'Invalid API key. Please check your OpenAI API key.',
+    'RateLimitError': 'API rate limit exceeded. Please wait a moment and try again.',
+    'APIConnectionError': 'Cannot connect to OpenAI API. Please check your internet connection.',
+    'Timeout': 'Request timed out. Please try again.',
+    'InvalidRequestError': 'Invalid request to API. Please check your inputs.',
+})
+
+# Columns every batch Excel file must have (validate_excel_structure), in report order
+_REQUIRED_COLUMNS = ('Company', 'Job Title')
+_REQUIRED_COLUMN_SET = frozenset(_REQUIRED_COLUMNS)
+
+# Control characters stripped by sanitize_text (everything below 0x20 except tab, newline and CR, plus DEL)
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -22,13 +39,15 @@ def validate_company_name(company: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not company or not company.strip():
+    # Strip once and branch on the length
+    length = len(company.strip()) if company else 0
+    if not length:
         return False, "Company name cannot be empty"
     
-    if len(company.strip()) < 2:
+    if length < 2:
         return False, "Company name must be at least 2 characters"
     
-    if len(company.strip()) > 100:
+    if length > 100:
         return False, "Company name must be less than 100 characters"
     
     return True, None
@@ -44,13 +63,15 @@ def validate_job_title(job_title: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not job_title or not job_title.strip():
+    # Strip once and branch on the length
+    length = len(job_title.strip()) if job_title else 0
+    if not length:
         return False, "Job title cannot be empty"
     
-    if len(job_title.strip()) < 2:
+    if length < 2:
         return False, "Job title must be at least 2 characters"
     
-    if len(job_title.strip()) > 150:
+    if length > 150:
         return False, "Job title must be less than 150 characters"
     
     return True, None
@@ -66,7 +87,8 @@ def validate_api_key(api_key: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not api_key or not api_key.strip():
+    # isspace() checks for a blank key without allocating a stripped copy
+    if not api_key or api_key.isspace():
         return False, "API key cannot be empty"
     
     if not api_key.startswith('sk-'):
@@ -91,24 +113,53 @@ def validate_excel_structure(df: pd.DataFrame) -> Tuple[bool, Optional[str]]:
     if df is None or df.empty:
         return False, "Excel file is empty"
     
-    required_columns = ['Company', 'Job Title']
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = _REQUIRED_COLUMN_SET.difference(df.columns)
     
     if missing_columns:
-        return False, f"Missing required columns: {', '.join(missing_columns)}"
+        return False, f"Missing required columns: {', '.join(sorted(missing_columns))}"
     
-    # Check for empty required fields
-    for col in required_columns:
-        empty_count = df[col].isna().sum() + (df[col] == '').sum()
-        if empty_count > 0:
-            return False, f"Column '{col}' has {empty_count} empty rows. Please fill all required fields."
+    # Check for empty required fields - one vectorized pass over all required columns
+    required_columns = list(_REQUIRED_COLUMNS)
+    values = df[required_columns].to_numpy(dtype=object)
+    empty_counts = (pd.isna(values) | (values == '')).sum(axis=0)
+    if empty_counts.any():
+        for col, empty_count in zip(required_columns, empty_counts):
+            if empty_count > 0:
+                return False, f"Column '{col}' has {empty_count} empty rows. Please fill all required fields."
     
     if len(df) > 100:
         return False, "Excel file contains more than 100 rows. Please process in smaller batches."
     
+    invalid_rows = validate_excel_rows(df)
+    if invalid_rows:
+        # Spreadsheet row numbers: the header is row 1, so the first data row is row 2
+        sheet_rows = df.index.isin(invalid_rows).nonzero()[0] + 2
+        return False, (
+            f"Rows {', '.join(map(str, sheet_rows))} have a company name (2-100 characters) or "
+            "job title (2-150 characters) of invalid length."
+        )
+    
     return True, None
 
 
+def validate_excel_rows(df: pd.DataFrame) -> list:
+    """
+    Check company name and job title lengths for every row at once (vectorized).
+    
+    Uses the same bounds as validate_company_name and validate_job_title.
+    
+    Args:
+        df: DataFrame with 'Company' and 'Job Title' columns
+        
+    Returns:
+        Index labels of the rows with an out-of-range company name or job title
+    """
+    company_len = df['Company'].astype(str).str.strip().str.len()
+    title_len = df['Job Title'].astype(str).str.strip().str.len()
+    invalid = (company_len < 2) | (company_len > 100) | (title_len < 2) | (title_len > 150)
+    return df.index[invalid].tolist()
+
+
 def sanitize_text(text: str) -> str:
     """
     Sanitize text input by removing potentially harmful characters.
@@ -123,12 +174,10 @@ def sanitize_text(text: str) -> str:
         return ""
     
     # Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_CTRL_TABLE)
     
-    # Trim excessive whitespace
-    text = ' '.join(text.split())
-    
-    return text.strip()
+    # Collapse whitespace runs; split() already drops leading/trailing whitespace
+    return ' '.join(text.split())
 
 
 def format_error_message(error: Exception) -> str:
@@ -142,21 +191,13 @@ def format_error_message(error: Exception) -> str:
         Formatted error message
     """
     error_type = type(error).__name__
-    error_msg = str(error)
-    
-    # Common error mappings
-    error_mappings = {
-        'AuthenticationError': 'Invalid API key. Please check your OpenAI API key.',
-        'RateLimitError': 'API rate limit exceeded. Please wait a moment and try again.',
-        'APIConnectionError': 'Cannot connect to OpenAI API. Please check your internet connection.',
-        'Timeout': 'Request timed out. Please try again.',
-        'InvalidRequestError': 'Invalid request to API. Please check your inputs.',
-    }
     
-    if error_type in error_mappings:
-        return error_mappings[error_type]
+    mapped = _ERROR_MAPPINGS.get(error_type)
+    if mapped is not None:
+        return mapped
     
     # Return generic message for unknown errors
+    error_msg = str(error)
     if error_msg:
         return f"{error_type}: {error_msg}"
     
@@ -198,22 +239,16 @@ def estimate_processing_time(num_jobs: int, use_web_search: bool = True) -> str:
     
     if total_seconds < 60:
         return f"~{total_seconds} seconds"
-    elif total_seconds < 3600:
-        minutes = total_seconds // 60
+    
+    hours, minutes = divmod(total_seconds // 60, 60)
+    if not hours:
         return f"~{minutes} minute{'s' if minutes > 1 else ''}"
-    else:
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        return f"~{hours} hour{'s' if hours > 1 else ''} {minutes} minute{'s' if minutes > 1 else ''}"
+    return f"~{hours} hour{'s' if hours > 1 else ''} {minutes} minute{'s' if minutes > 1 else ''}"
 
 
-def create_sample_excel() -> pd.DataFrame:
-    """
-    Create a sample Excel DataFrame with example data.
-    
-    Returns:
-        Sample DataFrame
-    """
+@lru_cache(maxsize=1)
+def _sample_frame() -> pd.DataFrame:
+    """The sample data, built once (callers get copies via create_sample_excel)."""
     data = {
         'Company': [
             'Google',
@@ -241,6 +276,16 @@ def create_sample_excel() -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+def create_sample_excel() -> pd.DataFrame:
+    """
+    Create a sample Excel DataFrame with example data.
+    
+    Returns:
+        Sample DataFrame (a fresh copy - safe to modify)
+    """
+    return _sample_frame().copy()
+
+
 if __name__ == "__main__":
     # Test validation functions
     print("Testing validation functions...")